@@ -13,73 +13,107 @@ from __future__ import annotations
 # import asyncio
 import io
 import os
-import platform
 import re
 import subprocess
 import sys
 import xml.etree.ElementTree as ET
-from random import randint
+from itertools import chain, count
 from shutil import which
-from time import sleep
+from time import monotonic, sleep
 from tkinter import messagebox as msg
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Collection, Dict, List, Optional, Union
 from warnings import warn
-from xml.dom import minidom
 
 import openpyxl as pyxl
 import psutil
 
 # Enumerated parameters / Constants
 PROGRAM_NAME = "yEd.exe"
+YED_JAR_NAME = b"yed.jar"  # linux - yEd runs as java -jar yed.jar
 
 # Testing related triggers
 testing = False
 local_testing = None
 show_guis = True
 
-LINE_TYPES = [
-    "line",
-    "dashed",
-    "dotted",
-    "dashed_dotted",
-]
-
-FONT_STYLES = [
-    "plain",
-    "bold",
-    "italic",
-    "bolditalic",
-]
-
-HORIZONTAL_ALIGNMENTS = [
-    "left",
-    "center",
-    "right",
-]
-
-VERTICAL_ALIGNMENTS = [
-    "top",
-    "center",
-    "bottom",
-]
-
-CUSTOM_PROPERTY_SCOPES = [
-    "node",
-    "edge",
-]  # TODO: DOES THIS NEED GROUP?
-
-CUSTOM_PROPERTY_TYPES = [
-    "string",
-    "int",
-    "double",
-    "boolean",
-]
+LINE_TYPES = frozenset(
+    [
+        "line",
+        "dashed",
+        "dotted",
+        "dashed_dotted",
+    ]
+)
+
+FONT_STYLES = frozenset(
+    [
+        "plain",
+        "bold",
+        "italic",
+        "bolditalic",
+    ]
+)
+
+HORIZONTAL_ALIGNMENTS = frozenset(
+    [
+        "left",
+        "center",
+        "right",
+    ]
+)
+
+VERTICAL_ALIGNMENTS = frozenset(
+    [
+        "top",
+        "center",
+        "bottom",
+    ]
+)
+
+CUSTOM_PROPERTY_SCOPES = frozenset(
+    [
+        "node",
+        "edge",
+    ]
+)  # TODO: DOES THIS NEED GROUP?
+
+CUSTOM_PROPERTY_TYPES = frozenset(
+    [
+        "string",
+        "int",
+        "double",
+        "boolean",
+    ]
+)
+
+# Buffer size for writing graphml files (fewer write calls than the 8KB default on large graphs)
+GRAPHML_WRITE_BUFFER_SIZE = 128 * 1024
+
+# GraphML string simplification (see xml_to_simple_string - on raw bytes - and simplify_graphml_element)
+WHITESPACE_TO_SPACE = str.maketrans("\n\r\t", "   ")
+WHITESPACE_TO_SPACE_BYTES = bytes.maketrans(b"\n\r\t", b"   ")
+GRAPHML_OPENING_TAG_RE = re.compile(rb"<graphml .*?>")
+NAMESPACE_PREFIX_RE = re.compile(rb"y:|xml:|yfiles\.")
+REDUNDANT_SPACES_RE = re.compile(r" {2,}")
+REDUNDANT_SPACES_BYTES_RE = re.compile(rb" {2,}")
+YFILES_ATTRIBUTE_PREFIX = "yfiles."
+
+# GraphML key definitions written ahead of custom property keys (attribute order as written)
+GRAPHML_KEYS = (
+    {"id": "data_node", "for": "node", "yfiles.type": "nodegraphics"},
+    {"id": "url_node", "for": "node", "attr.name": "url", "attr.type": "string"},
+    {"id": "description_node", "for": "node", "attr.name": "description", "attr.type": "string"},
+    {"id": "url_edge", "for": "edge", "attr.name": "url", "attr.type": "string"},
+    {"id": "description_edge", "for": "edge", "attr.name": "description", "attr.type": "string"},
+)
+# ...and the edge graphics key, written after them
+GRAPHML_EDGE_GRAPHICS_KEY = {"id": "data_edge", "for": "edge", "yfiles.type": "edgegraphics"}
 
 
 def checkValue(
     parameter_name: str,
     value: Any,
-    validValues: Optional[List[str]] = None,
+    validValues: Optional[Collection[str]] = None,
 ) -> None:
     """Check whether given inputs
     (e.g. Shape, Arrow type, Line type, etc.)
@@ -88,7 +122,7 @@ def checkValue(
 
     if validValues:
         if value not in validValues:
-            raise ValueError(f"{parameter_name} '{value}' is not supported. Use: '{', '.join(validValues)}'")
+            raise ValueError(f"{parameter_name} '{value}' is not supported. Use: '{', '.join(sorted(validValues))}'")
 
 
 class File:
@@ -108,11 +142,10 @@ class File:
 
     def path_validate(self, temp_name_or_path=None):
         """Validate if the file was initialized with valid path - returning the same path - if not valid, return working directory as default path."""
-        path = os.getcwd()
-        if temp_name_or_path:
-            path = os.path.dirname(temp_name_or_path)
-            if not os.path.exists(path):
-                path = os.getcwd()
+        path = os.path.dirname(temp_name_or_path) if temp_name_or_path else ""
+        # bare / missing names and invalid directories fall back to the working directory (already resolved)
+        if not path or not os.path.isdir(path):
+            return os.getcwd()
         return os.path.realpath(path)
 
     def base_name_validate(self, temp_name_or_path=None):
@@ -135,8 +168,16 @@ class File:
 class Label:
     """Generic Label Class for nodes / edges in yEd"""
 
+    # labels are created per node / edge - slots keep them free of a per instance __dict__
+    __slots__ = ("_text", "_params")
+
     graphML_tagName = None
 
+    # validated parameter dicts for previously seen argument combinations (mostly defaults) - copied per label
+    # only combinations of str / None arguments are kept (hashable, and equal keys mean equal values)
+    _params_templates: dict[tuple, dict] = {}
+    PARAMS_TEMPLATES_LIMIT = 256
+
     def __init__(
         self,
         text="",
@@ -163,6 +204,30 @@ class Label:
 
         self._text = text
 
+        # Reuse parameters already validated for the same arguments
+        template_key = (
+            horizontal_text_position,
+            vertical_text_position,
+            alignment,
+            font_style,
+            font_family,
+            icon_text_gap,
+            font_size,
+            text_color,
+            visible,
+            underlined_text,
+            has_background_color,
+            width,
+            height,
+            border_color,
+            background_color,
+        )
+        cacheable = all(value is None or type(value) is str for value in template_key)
+        template = Label._params_templates.get(template_key) if cacheable else None
+        if template is not None:
+            self._params = template.copy()
+            return
+
         # Initialize dictionary for parameters
         self._params = {}
         self.updateParam("horizontalTextPosition", horizontal_text_position, HORIZONTAL_ALIGNMENTS)
@@ -185,6 +250,9 @@ class Label:
         self.updateParam("borderColor", border_color)
         self.updateParam("backgroundColor", background_color)
 
+        if cacheable and len(Label._params_templates) < Label.PARAMS_TEMPLATES_LIMIT:
+            Label._params_templates[template_key] = self._params.copy()
+
     def updateParam(
         self,
         parameter_name,
@@ -195,23 +263,29 @@ class Label:
             return False
         checkValue(parameter_name, value, validValues)
 
+        # label values repeat heavily (esp. when read from file) - share one string object per value
+        if isinstance(value, str):
+            value = sys.intern(value)
         self._params[parameter_name] = value
         return True
 
     def addSubElement(self, shape):
-        label = ET.SubElement(shape, self.graphML_tagName, **self._params)
+        # params handed over as the attrib mapping (copied once by ElementTree) rather than expanded as kwargs
+        label = ET.SubElement(shape, self.graphML_tagName, attrib=self._params)
         label.text = self._text
 
 
 class NodeLabel(Label):
     """Node specific label"""
 
+    __slots__ = ()
+
     VALIDMODELPARAMS = {
-        "internal": ["t", "b", "c", "l", "r", "tl", "tr", "bl", "br"],
-        "corners": ["nw", "ne", "sw", "se"],
-        "sandwich": ["n", "s"],
-        "sides": ["n", "e", "s", "w"],
-        "eight_pos": ["n", "e", "s", "w", "nw", "ne", "sw", "se"],
+        "internal": frozenset(["t", "b", "c", "l", "r", "tl", "tr", "bl", "br"]),
+        "corners": frozenset(["nw", "ne", "sw", "se"]),
+        "sandwich": frozenset(["n", "s"]),
+        "sides": frozenset(["n", "e", "s", "w"]),
+        "eight_pos": frozenset(["n", "e", "s", "w", "nw", "ne", "sw", "se"]),
     }
 
     graphML_tagName = "y:NodeLabel"
@@ -265,11 +339,13 @@ class NodeLabel(Label):
 class EdgeLabel(Label):
     """Edge specific label"""
 
+    __slots__ = ()
+
     VALIDMODELPARAMS = {
-        "two_pos": ["head", "tail"],
-        "centered": ["center"],
-        "six_pos": ["shead", "thead", "head", "stail", "ttail", "tail"],
-        "three_center": ["center", "scentr", "tcentr"],
+        "two_pos": frozenset(["head", "tail"]),
+        "centered": frozenset(["center"]),
+        "six_pos": frozenset(["shead", "thead", "head", "stail", "ttail", "tail"]),
+        "three_center": frozenset(["center", "scentr", "tcentr"]),
         "center_slider": None,
         "side_slider": None,
     }
@@ -348,41 +424,58 @@ class CustomPropertyDefinition:
         self.id = "%s_%s" % (self.scope, self.name)
 
     def convert_to_xml(self) -> ET.Element:
-        custom_prop_key = ET.Element("key", id=self.id)
-        custom_prop_key.set("for", self.scope)
-        custom_prop_key.set("attr.name", self.name)
-        custom_prop_key.set("attr.type", self.property_type)
-
-        return custom_prop_key
+        return ET.Element(
+            "key", {"id": self.id, "for": self.scope, "attr.name": self.name, "attr.type": self.property_type}
+        )
 
 
 class Node:
     """yEd Node object - representing a single node in the graph"""
 
+    # fixed attributes in slots - __dict__ kept only for custom properties (set by name per definition)
+    __slots__ = (
+        "id",
+        "name",
+        "parent",
+        "top_level_graph",
+        "list_of_labels",
+        "node_type",
+        "UML",
+        "shape",
+        "shape_fill",
+        "transparent",
+        "border_color",
+        "border_width",
+        "border_type",
+        "geom",
+        "description",
+        "url",
+        "__dict__",
+    )
+
     custom_properties_defs = {}
 
-    VALID_NODE_SHAPES = [
-        "rectangle",
-        "rectangle3d",
-        "roundrectangle",
-        "diamond",
-        "ellipse",
-        "fatarrow",
-        "fatarrow2",
-        "hexagon",
-        "octagon",
-        "parallelogram",
-        "parallelogram2",
-        "star5",
-        "star6",
-        "star6",
-        "star8",
-        "trapezoid",
-        "trapezoid2",
-        "triangle",
-        "trapezoid2",
-        "triangle",
-    ]
+    VALID_NODE_SHAPES = frozenset(
+        [
+            "rectangle",
+            "rectangle3d",
+            "roundrectangle",
+            "diamond",
+            "ellipse",
+            "fatarrow",
+            "fatarrow2",
+            "hexagon",
+            "octagon",
+            "parallelogram",
+            "parallelogram2",
+            "star5",
+            "star6",
+            "star8",
+            "trapezoid",
+            "trapezoid2",
+            "triangle",
+        ]
+    )
 
     def __init__(
         self,
@@ -412,16 +505,17 @@ class Node:
         self.id: str = generate_temp_uuid()  # temporary unique
         self.parent: Union[(Group, Graph, None)] = None
 
-        self.list_of_labels: list[NodeLabel] = []  # initialize list of labels
-
-        self.add_label(
-            label_text=name,
-            alignment=label_alignment,
-            font_family=font_family,
-            underlined_text=underlined_text,
-            font_style=font_style,
-            font_size=font_size,
-        )
+        # initialize list of labels with the name label (further labels via add_label)
+        self.list_of_labels: list[NodeLabel] = [
+            NodeLabel(
+                name,
+                alignment=label_alignment,
+                font_family=font_family,
+                underlined_text=underlined_text,
+                font_style=font_style,
+                font_size=font_size,
+            )
+        ]
 
         self.node_type = node_type
         self.UML = UML
@@ -442,32 +536,22 @@ class Node:
         self.border_type = border_type
 
         # geometry
-        self.geom = {}
+        geom = {}
         if height:
-            self.geom["height"] = height
+            geom["height"] = height
         if width:
-            self.geom["width"] = width
+            geom["width"] = width
         if x:
-            self.geom["x"] = x
+            geom["x"] = x
         if y:
-            self.geom["y"] = y
+            geom["y"] = y
+        self.geom: dict[str, str] = geom
 
         self.description = description
         self.url = url
 
         # Handle Node Custom Properties
-        for name, definition in Node.custom_properties_defs.items():
-            if custom_properties:
-                for k, v in custom_properties.items():
-                    if k not in Node.custom_properties_defs:
-                        raise RuntimeWarning("key %s not recognised" % k)
-                    if name == k:
-                        setattr(self, name, custom_properties[k])
-                        break
-                else:
-                    setattr(self, name, definition.default_value)
-            else:
-                setattr(self, name, definition.default_value)
+        assign_custom_properties(self, Node.custom_properties_defs, custom_properties)
 
     def add_label(self, label_text, **kwargs) -> Node:
         """Adds node label - > returns node for continued node operations"""
@@ -475,60 +559,68 @@ class Node:
         return self
 
     def convert_to_xml(self) -> ET.Element:
-        """Converting node object to xml object"""
+        """Converting node object to xml object (detached element)"""
+        return self.populate_element(ET.Element("graph"))
 
-        xml_node = ET.Element("node", id=str(self.id))
-        data = ET.SubElement(xml_node, "data", key="data_node")
+    def populate_element(self, parent: ET.Element) -> ET.Element:
+        """Creating node xml directly under the given parent element - returns the node element"""
+
+        # attributes passed as attrib dict literals - one dict per element rather than kwargs plus merge copy
+        xml_node = ET.SubElement(parent, "node", {"id": str(self.id)})
+        data = ET.SubElement(xml_node, "data", {"key": "data_node"})
         shape = ET.SubElement(data, "y:" + self.node_type)
 
         if self.geom:
-            ET.SubElement(shape, "y:Geometry", **self.geom)
+            ET.SubElement(shape, "y:Geometry", self.geom)
         # <y:Geometry height="30.0" width="30.0" x="475.0" y="727.0"/>
 
-        ET.SubElement(shape, "y:Fill", color=self.shape_fill, transparent=self.transparent)
+        ET.SubElement(shape, "y:Fill", {"color": self.shape_fill, "transparent": self.transparent})
 
         ET.SubElement(
             shape,
             "y:BorderStyle",
-            color=self.border_color,
-            type=self.border_type,
-            width=self.border_width,
+            {
+                "color": self.border_color,
+                "type": self.border_type,
+                "width": self.border_width,
+            },
         )
 
         for label in self.list_of_labels:
             label.addSubElement(shape)
 
-        ET.SubElement(shape, "y:Shape", type=self.shape)
+        ET.SubElement(shape, "y:Shape", {"type": self.shape})
 
         # UML specific
         if self.UML:
-            UML = ET.SubElement(shape, "y:UML")
-
-            attributes = ET.SubElement(UML, "y:AttributeLabel", type=self.shape)
-            attributes.text = self.UML["attributes"]
-
-            methods = ET.SubElement(UML, "y:MethodLabel", type=self.shape)
-            methods.text = self.UML["methods"]
-
-            stereotype = self.UML["stereotype"] if "stereotype" in self.UML else ""
-            UML.set("stereotype", stereotype)
+            self.add_uml_xml(shape)
 
         # Special items
         if self.url:
-            url_node = ET.SubElement(xml_node, "data", key="url_node")
+            url_node = ET.SubElement(xml_node, "data", {"key": "url_node"})
             url_node.text = self.url
 
         if self.description:
-            description_node = ET.SubElement(xml_node, "data", key="description_node")
+            description_node = ET.SubElement(xml_node, "data", {"key": "description_node"})
             description_node.text = self.description
 
         # Node Custom Properties
         for name, definition in Node.custom_properties_defs.items():
-            node_custom_prop = ET.SubElement(xml_node, "data", key=definition.id)
+            node_custom_prop = ET.SubElement(xml_node, "data", {"key": definition.id})
             node_custom_prop.text = getattr(self, name)
 
         return xml_node
 
+    def add_uml_xml(self, shape: ET.Element) -> None:
+        """Adding UML attribute / method labels to the node shape xml (only for UML nodes)"""
+        UML = ET.SubElement(shape, "y:UML", {"stereotype": self.UML.get("stereotype", "")})
+
+        attributes = ET.SubElement(UML, "y:AttributeLabel", {"type": self.shape})
+        attributes.text = self.UML["attributes"]
+
+        methods = ET.SubElement(UML, "y:MethodLabel", {"type": self.shape})
+        methods.text = self.UML["methods"]
+
     @classmethod
     def set_custom_properties_defs(cls, custom_property) -> None:
         cls.custom_properties_defs[custom_property.name] = custom_property
@@ -537,30 +629,51 @@ class Node:
 class Edge:
     """yEd Edge - connecting Nodes or Groups"""
 
+    # fixed attributes in slots - __dict__ kept only for custom properties (set by name per definition)
+    __slots__ = (
+        "id",
+        "name",
+        "parent",
+        "top_level_graph",
+        "node1",
+        "node2",
+        "list_of_labels",
+        "arrowhead",
+        "arrowfoot",
+        "line_type",
+        "color",
+        "width",
+        "description",
+        "url",
+        "__dict__",
+    )
+
     custom_properties_defs = {}
 
-    ARROW_TYPES = [
-        "none",
-        "standard",
-        "white_delta",
-        "diamond",
-        "white_diamond",
-        "short",
-        "plain",
-        "concave",
-        "convex",
-        "circle",
-        "transparent_circle",
-        "dash",
-        "skewed_dash",
-        "t_shape",
-        "crows_foot_one_mandatory",
-        "crows_foot_many_mandatory",
-        "crows_foot_many_optional",
-        "crows_foot_one",
-        "crows_foot_many",
-        "crows_foot_optional",
-    ]
+    ARROW_TYPES = frozenset(
+        [
+            "none",
+            "standard",
+            "white_delta",
+            "diamond",
+            "white_diamond",
+            "short",
+            "plain",
+            "concave",
+            "convex",
+            "circle",
+            "transparent_circle",
+            "dash",
+            "skewed_dash",
+            "t_shape",
+            "crows_foot_one_mandatory",
+            "crows_foot_many_mandatory",
+            "crows_foot_many_optional",
+            "crows_foot_one",
+            "crows_foot_many",
+            "crows_foot_optional",
+        ]
+    )
 
     def __init__(
         self,
@@ -584,39 +697,47 @@ class Edge:
         self.node1: Node = node1
         self.node2: Node = node2
         self.name: str = name
-        self.list_of_labels: list[EdgeLabel] = []  # initialize list of labels
         self.id: str = generate_temp_uuid()  # give temp id
         self.parent: Union[(Group, Graph, None)] = None
 
+        # initialize list of labels directly (name / source / target as given) - further labels via add_label
+        labels: list[EdgeLabel] = []
         if name:
-            self.add_label(
-                name,
-                border_color=label_border_color,
-                background_color=label_background_color,
+            labels.append(
+                EdgeLabel(
+                    name,
+                    border_color=label_border_color,
+                    background_color=label_background_color,
+                )
             )
 
         # if not node1 or not node2:
         #     id = "%s_%s" % (node1, node2)
 
         if source_label is not None:
-            self.add_label(
-                source_label,
-                model_name="six_pos",
-                model_position="shead",
-                preferred_placement="source_on_edge",
-                border_color=label_border_color,
-                background_color=label_background_color,
+            labels.append(
+                EdgeLabel(
+                    source_label,
+                    model_name="six_pos",
+                    model_position="shead",
+                    preferred_placement="source_on_edge",
+                    border_color=label_border_color,
+                    background_color=label_background_color,
+                )
             )
 
         if target_label is not None:
-            self.add_label(
-                target_label,
-                model_name="six_pos",
-                model_position="shead",
-                preferred_placement="source_on_edge",
-                border_color=label_border_color,
-                background_color=label_background_color,
+            labels.append(
+                EdgeLabel(
+                    target_label,
+                    model_name="six_pos",
+                    model_position="shead",
+                    preferred_placement="source_on_edge",
+                    border_color=label_border_color,
+                    background_color=label_background_color,
+                )
             )
+        self.list_of_labels: list[EdgeLabel] = labels
 
         checkValue("arrowhead", arrowhead, Edge.ARROW_TYPES)
         self.arrowhead = arrowhead
@@ -634,18 +755,7 @@ class Edge:
         self.url = url
 
         # Handle Edge Custom Properties
-        for name, definition in Edge.custom_properties_defs.items():
-            if custom_properties:
-                for k, v in custom_properties.items():
-                    if k not in Edge.custom_properties_defs:
-                        raise RuntimeWarning("key %s not recognised" % k)
-                    if name == k:
-                        setattr(self, name, custom_properties[k])
-                        break
-                else:
-                    setattr(self, name, definition.default_value)
-            else:
-                setattr(self, name, definition.default_value)
+        assign_custom_properties(self, Edge.custom_properties_defs, custom_properties)
 
     def add_label(self, label_text, **kwargs):
         """Adding edge label"""
@@ -654,30 +764,36 @@ class Edge:
         return self
 
     def convert_to_xml(self) -> ET.Element:
-        """Converting edge object to xml object"""
+        """Converting edge object to xml object (detached element)"""
+        return self.populate_element(ET.Element("graph"))
 
-        edge = ET.Element("edge", id=str(self.id), source=str(self.node1.id), target=str(self.node2.id))
+    def populate_element(self, parent: ET.Element) -> ET.Element:
+        """Creating edge xml directly under the given parent element - returns the edge element"""
 
-        data = ET.SubElement(edge, "data", key="data_edge")
+        edge = ET.SubElement(
+            parent, "edge", {"id": str(self.id), "source": str(self.node1.id), "target": str(self.node2.id)}
+        )
+
+        data = ET.SubElement(edge, "data", {"key": "data_edge"})
         pl = ET.SubElement(data, "y:PolyLineEdge")
 
-        ET.SubElement(pl, "y:Arrows", source=self.arrowfoot, target=self.arrowhead)
-        ET.SubElement(pl, "y:LineStyle", color=self.color, type=self.line_type, width=self.width)
+        ET.SubElement(pl, "y:Arrows", {"source": self.arrowfoot, "target": self.arrowhead})
+        ET.SubElement(pl, "y:LineStyle", {"color": self.color, "type": self.line_type, "width": self.width})
 
         for label in self.list_of_labels:
             label.addSubElement(pl)
 
         if self.url:
-            url_edge = ET.SubElement(edge, "data", key="url_edge")
+            url_edge = ET.SubElement(edge, "data", {"key": "url_edge"})
             url_edge.text = self.url
 
         if self.description:
-            description_edge = ET.SubElement(edge, "data", key="description_edge")
+            description_edge = ET.SubElement(edge, "data", {"key": "description_edge"})
             description_edge.text = self.description
 
         # Edge Custom Properties
         for name, definition in Edge.custom_properties_defs.items():
-            edge_custom_prop = ET.SubElement(edge, "data", key=definition.id)
+            edge_custom_prop = ET.SubElement(edge, "data", {"key": definition.id})
             edge_custom_prop.text = getattr(self, name)
 
         return edge
@@ -690,28 +806,55 @@ class Edge:
 class Group:
     """yEd Group Object (Visual Container of Nodes / Edges / also can recursively act as Node)"""
 
-    VALID_SHAPES = [
-        "rectangle",
-        "rectangle3d",
-        "roundrectangle",
-        "diamond",
-        "ellipse",
-        "fatarrow",
-        "fatarrow2",
-        "hexagon",
-        "octagon",
-        "parallelogram",
-        "parallelogram2",
-        "star5",
-        "star6",
-        "star6",
-        "star8",
-        "trapezoid",
-        "trapezoid2",
-        "triangle",
-        "trapezoid2",
-        "triangle",
-    ]
+    # fixed attributes in slots - __dict__ kept only for custom properties (set by name per definition)
+    __slots__ = (
+        "id",
+        "name",
+        "parent",
+        "top_level_graph",
+        "nodes",
+        "groups",
+        "edges",
+        "combined_objects",
+        "shape",
+        "closed",
+        "font_family",
+        "underlined_text",
+        "font_style",
+        "font_size",
+        "label_alignment",
+        "fill",
+        "transparent",
+        "geom",
+        "border_color",
+        "border_width",
+        "border_type",
+        "description",
+        "url",
+        "__dict__",
+    )
+
+    VALID_SHAPES = frozenset(
+        [
+            "rectangle",
+            "rectangle3d",
+            "roundrectangle",
+            "diamond",
+            "ellipse",
+            "fatarrow",
+            "fatarrow2",
+            "hexagon",
+            "octagon",
+            "parallelogram",
+            "parallelogram2",
+            "star5",
+            "star6",
+            "star8",
+            "trapezoid",
+            "trapezoid2",
+            "triangle",
+        ]
+    )
 
     def __init__(
         self,
@@ -768,15 +911,16 @@ class Group:
         self.fill = fill
         self.transparent = transparent
 
-        self.geom = {}
+        geom = {}
         if height:
-            self.geom["height"] = height
+            geom["height"] = height
         if width:
-            self.geom["width"] = width
+            geom["width"] = width
         if x:
-            self.geom["x"] = x
+            geom["x"] = x
         if y:
-            self.geom["y"] = y
+            geom["y"] = y
+        self.geom: dict[str, str] = geom
 
         self.border_color = border_color
         self.border_width = border_width
@@ -788,18 +932,7 @@ class Group:
         self.url = url
 
         # Handle Node Custom Properties
-        for name, definition in Node.custom_properties_defs.items():
-            if custom_properties:
-                for k, v in custom_properties.items():
-                    if k not in Node.custom_properties_defs:
-                        raise RuntimeWarning("key %s not recognised" % k)
-                    if name == k:
-                        setattr(self, name, custom_properties[k])
-                        break
-                else:
-                    setattr(self, name, definition.default_value)
-            else:
-                setattr(self, name, definition.default_value)
+        assign_custom_properties(self, Node.custom_properties_defs, custom_properties)
 
     def add_node(self, node: Union[Node, str, None] = None, **kwargs) -> Node:
         """Adding node within Group - accepts node object (simply assigns), or node name or none (to create new node without name)."""
@@ -843,73 +976,71 @@ class Group:
         return node.parent is not None and (node.parent is self or self.is_ancestor(node.parent))
 
     def convert_to_xml(self) -> ET.Element:
-        """Converting graph object to graphml xml object"""
+        """Converting group object to xml object (detached element)"""
+        return self.populate_element(ET.Element("graph"))
 
-        node = ET.Element("node", id=self.id)
-        node.set("yfiles.foldertype", "group")
-        data = ET.SubElement(node, "data", key="data_node")
+    def populate_element(self, parent: ET.Element) -> ET.Element:
+        """Creating group xml (and contained items) directly under the given parent element - returns the group element"""
+
+        node = ET.SubElement(parent, "node", {"id": self.id, "yfiles.foldertype": "group"})
+        data = ET.SubElement(node, "data", {"key": "data_node"})
 
         # node for group
         pabn = ET.SubElement(data, "y:ProxyAutoBoundsNode")
-        r = ET.SubElement(pabn, "y:Realizers", active="0")
+        r = ET.SubElement(pabn, "y:Realizers", {"active": "0"})
         group_node = ET.SubElement(r, "y:GroupNode")
 
         if self.geom:
-            ET.SubElement(group_node, "y:Geometry", **self.geom)
+            ET.SubElement(group_node, "y:Geometry", self.geom)
 
-        ET.SubElement(group_node, "y:Fill", color=self.fill, transparent=self.transparent)
+        ET.SubElement(group_node, "y:Fill", {"color": self.fill, "transparent": self.transparent})
 
         ET.SubElement(
             group_node,
             "y:BorderStyle",
-            color=self.border_color,
-            type=self.border_type,
-            width=self.border_width,
+            {
+                "color": self.border_color,
+                "type": self.border_type,
+                "width": self.border_width,
+            },
         )
 
         label = ET.SubElement(
             group_node,
             "y:NodeLabel",
-            modelName="internal",
-            modelPosition="t",
-            fontFamily=self.font_family,
-            fontSize=self.font_size,
-            underlinedText=self.underlined_text,
-            fontStyle=self.font_style,
-            alignment=self.label_alignment,
+            {
+                "modelName": "internal",
+                "modelPosition": "t",
+                "fontFamily": self.font_family,
+                "fontSize": self.font_size,
+                "underlinedText": self.underlined_text,
+                "fontStyle": self.font_style,
+                "alignment": self.label_alignment,
+            },
         )
         label.text = self.name
 
-        ET.SubElement(group_node, "y:Shape", type=self.shape)
+        ET.SubElement(group_node, "y:Shape", {"type": self.shape})
 
-        ET.SubElement(group_node, "y:State", closed=self.closed)
+        ET.SubElement(group_node, "y:State", {"closed": self.closed})
 
-        graph = ET.SubElement(node, "graph", edgedefault="directed", id=self.id)
+        graph = ET.SubElement(node, "graph", {"edgedefault": "directed", "id": self.id})
 
         if self.url:
-            url_node = ET.SubElement(node, "data", key="url_node")
+            url_node = ET.SubElement(node, "data", {"key": "url_node"})
             url_node.text = self.url
 
         if self.description:
-            description_node = ET.SubElement(node, "data", key="description_node")
+            description_node = ET.SubElement(node, "data", {"key": "description_node"})
             description_node.text = self.description
 
-        # Add group contained items (recursive)
-        for id in self.nodes:
-            n = self.nodes[id].convert_to_xml()
-            graph.append(n)
-
-        for id in self.groups:
-            n = self.groups[id].convert_to_xml()
-            graph.append(n)
-
-        for id in self.edges:
-            e = self.edges[id].convert_to_xml()
-            graph.append(e)
+        # Add group contained items (recursive) - nodes, groups, then edges
+        for item in chain(self.nodes.values(), self.groups.values(), self.edges.values()):
+            item.populate_element(graph)
 
         # Node Custom Properties
         for name, definition in Node.custom_properties_defs.items():
-            node_custom_prop = ET.SubElement(node, "data", key=definition.id)
+            node_custom_prop = ET.SubElement(node, "data", {"key": definition.id})
             node_custom_prop.text = getattr(self, name)
 
         return node
@@ -924,20 +1055,22 @@ class GraphStats:
         self.gather_metadata()  # initial extraction
 
     def recursive_id_extract(self, graph_or_input_node) -> None:
-        """Gather complete structure of current (recursive) graph objects and relationships."""
-        sub_nodes = graph_or_input_node.nodes.values()
-        sub_groups = graph_or_input_node.groups.values()
-        sub_edges = graph_or_input_node.edges.values()
+        """Gather complete structure of current (recursive) graph objects and relationships.
+        Walks the group hierarchy with an explicit stack (same depth first order as recursion, no recursion limit)."""
+        stack = [graph_or_input_node]
+        while stack:
+            container = stack.pop()
+            if container is not graph_or_input_node:
+                self.all_groups[container.id] = container
 
-        for node in sub_nodes:
-            self.all_nodes[node.id] = node
+            for node in container.nodes.values():
+                self.all_nodes[node.id] = node
 
-        for edge in sub_edges:
-            self.all_edges[edge.id] = edge
+            for edge in container.edges.values():
+                self.all_edges[edge.id] = edge
 
-        for group in sub_groups:
-            self.all_groups[group.id] = group
-            self.recursive_id_extract(group)
+            # reversed so that groups are popped (visited) in their stored order
+            stack.extend(reversed(container.groups.values()))
 
     def gather_metadata(self):
         """Gather metadata for all objects in the graph."""
@@ -951,6 +1084,7 @@ class GraphStats:
         self.id_to_name: dict[str, str] = {}
         self.name_to_ids: dict[str, list[str]] = {}
         self.duplicate_names: set[str] = set()
+        self.dup_ids: set[str] = set()  # ids of objects whose name is shared (need disambiguation)
 
         # (re)extract core graph data
         self.recursive_id_extract(self.graph)
@@ -960,11 +1094,13 @@ class GraphStats:
         self.all_graph_items = {**self.all_objects, **self.all_edges}
         for obj in self.all_graph_items.values():
             self.id_to_name[obj.id] = obj.name
-            current_ids = self.name_to_ids.get(obj.name, [])
+            current_ids = self.name_to_ids.setdefault(obj.name, [])
             if current_ids:
                 self.duplicate_names.add(obj.name)
             current_ids.append(obj.id)
-            self.name_to_ids[obj.name] = current_ids
+
+        for name in self.duplicate_names:
+            self.dup_ids.update(self.name_to_ids[name])
 
     def find_by_id(self, id) -> Union[Node, Group, Edge, None]:
         """Find object by unique yEd id."""
@@ -989,6 +1125,7 @@ class ExcelManager:
         self.OBJECTS_WS_NAME = "Objects_and_Groups"
         self.RELATIONS_WS_NAME = "Relations"
         self.DISAMBIGUATING_SEPARATOR = "##ID:##"
+        self.kill_external_app = False  # set only once we have opened Excel for the user
 
         # Graph operations ================
         self.graph = Graph()
@@ -1000,8 +1137,15 @@ class ExcelManager:
         # self.dup_objects = list()
 
     def kill_excel(self) -> None:
-        """Providing a utility to help primarily during test"""
-        os.system('taskkill /f /im "excel.exe"')  # FIXME: Windows only
+        """Close the Excel instance we opened for the user (no-op if we never opened one)."""
+        if not self.kill_external_app:
+            return
+        try:
+            # argument list - no intermediate shell
+            subprocess.run(["taskkill", "/f", "/im", "excel.exe"], check=False)  # FIXME: Windows only
+        except FileNotFoundError:
+            pass  # no taskkill on this platform
+        self.kill_external_app = False
 
     def bulk_data_op_verify(self, type) -> None:
         """Check if the given bulk data management type is valid for Excel operations."""
@@ -1009,14 +1153,11 @@ class ExcelManager:
         if self.type not in self.WB_TYPES:
             raise RuntimeWarning("Invalid Excel type. Use: %s" % ", ".join(self.WB_TYPES))
 
-    def create_excel_template(self, type) -> None:
-        """Generate excel wb per template for that wb type."""
+    def create_excel_template(self, type) -> pyxl.Workbook:
+        """Generate excel wb per template for that wb type (in memory - saved once filled)."""
 
         self.bulk_data_op_verify(type)
 
-        if os.path.isfile(self.TEMP_EXCEL_SHEET):
-            os.remove(self.TEMP_EXCEL_SHEET)
-
         # create workbook
         excel_wb = pyxl.Workbook()
 
@@ -1045,9 +1186,7 @@ class ExcelManager:
         # Clean up
         if excel_ws:
             excel_wb.remove(excel_ws)  # removing default sheet
-        self.kill_excel()
-        excel_wb.save(self.TEMP_EXCEL_SHEET)
-        excel_wb.close()
+        return excel_wb
 
     def open_close_excel(*args, **kwargs):
         """Provide wrapper for opening / saving / closing excel ops."""
@@ -1060,12 +1199,9 @@ class ExcelManager:
                 type = kwargs.get("type", None)
                 self.bulk_data_op_verify(type)
 
-                # Graph to excel
+                # Graph to excel - template workbook is filled directly in memory
                 if save:
-                    self.create_excel_template(type)
-                    sleep(0.5)  # FIXME: Unclear if necessary
-                    with open(self.TEMP_EXCEL_SHEET, "rb") as f:
-                        in_mem_file = io.BytesIO(f.read())
+                    self.excel_wb = self.create_excel_template(type)
 
                 # Excel to graph
                 else:
@@ -1083,12 +1219,13 @@ class ExcelManager:
                         with open(self.TEMP_EXCEL_SHEET, "rb") as f:
                             in_mem_file = io.BytesIO(f.read())
 
-                # If nothing in memory at this point we have an issue
-                if not in_mem_file:
-                    raise RuntimeWarning("No excel data found to open.")
+                    # If nothing in memory at this point we have an issue
+                    if not in_mem_file:
+                        raise RuntimeWarning("No excel data found to open.")
+
+                    # provide fresh handles (excel to graph only reads values - streamed in read only mode)
+                    self.excel_wb = pyxl.load_workbook(in_mem_file, read_only=True, data_only=True, keep_links=False)
 
-                # provide fresh handles
-                self.excel_wb = pyxl.load_workbook(in_mem_file)
                 self.objects_ws = self.excel_wb[self.OBJECTS_WS_NAME]
                 if self.type == "relations":
                     self.relations_ws = self.excel_wb[self.RELATIONS_WS_NAME]
@@ -1096,9 +1233,11 @@ class ExcelManager:
                 # Perform functions operations
                 func(self, *args, **kwargs)
 
-                # Clean up
+                # Clean up (read only workbooks hold their archive open until closed)
                 if save:
                     self.excel_wb.save(self.TEMP_EXCEL_SHEET)
+                else:
+                    self.excel_wb.close()
                 self.kill_excel()
 
             return wrapper_func
@@ -1112,7 +1251,7 @@ class ExcelManager:
         if direction == "out":
             if not obj:
                 return None
-            if obj.name in self.original_stats.duplicate_names:  # migrate to using graphstats
+            if obj.id in self.original_stats.dup_ids:
                 return obj.name + self.DISAMBIGUATING_SEPARATOR + obj.id  # FIXME: IN EXCEL_TO_GRAPH
             else:
                 return obj.name
@@ -1120,19 +1259,16 @@ class ExcelManager:
             if not obj:
                 return None, None
 
-            if self.DISAMBIGUATING_SEPARATOR in obj:
-                name = obj.split(self.DISAMBIGUATING_SEPARATOR)[0]
-                id = obj.split(self.DISAMBIGUATING_SEPARATOR)[1]
-                if not all([name, id]):
-                    warn(f"Invalid deduplication format of edge information or empty name: {name}:{id}.", SyntaxWarning)
-                    return name, id
-                # Normal situation in deduplication notation
-                else:
-                    return name, id
+            name, separator, id = obj.partition(self.DISAMBIGUATING_SEPARATOR)
             # For normal non duplicate case
-            else:
+            if not separator:
                 return obj, None  # name,id
 
+            # Normal situation in deduplication notation
+            if not (name and id):
+                warn(f"Invalid deduplication format of edge information or empty name: {name}:{id}.", SyntaxWarning)
+            return name, id
+
     @open_close_excel(save=True)
     def graph_to_excel_conversion(self, type=None, graph=None) -> None:
         """Converting graph object to excel sheet format for bulk data management operations."""
@@ -1143,95 +1279,92 @@ class ExcelManager:
         # Lets gather starting stats
         self.original_stats = self.graph.gather_graph_stats()
 
-        def graph_object_extract_to_excel(self, input_node: Union[Group, Graph], indent_level):
-            """Extracting graph objects to excel."""
-            nonlocal row
-
-            sub_nodes = input_node.nodes
-            sub_groups = input_node.groups
-
-            for node in sub_nodes.values():
-                # desc = node.get(description, "")
-                # url = node.get(url, "")
-
-                # posting to excel
-                self.objects_ws.cell(row=row, column=indent_level, value=node.name)
-                self.objects_ws.cell(row=row, column=indent_level + 1, value=node.id)
-                row += 1
-
-            for group in sub_groups.values():
-                # id = group.id or ""
-                # label = getattr(group, "label", "")
-
-                # posting to excel
-                self.objects_ws.cell(row=row, column=indent_level, value=group.name)
-                self.objects_ws.cell(row=row, column=indent_level + 1, value=group.id)
-                row += 1
-
-                # Recursive extraction - adapting indent
-                graph_object_extract_to_excel(self, group, indent_level=indent_level + 1)
+        # excel names per object - objects recur across edges (endpoints, owners), names / ids fixed during conversion
+        excel_names: dict[int, Optional[str]] = {}
+
+        def excel_name(obj) -> Optional[str]:
+            """Disambiguated excel name of object (memoized per conversion)."""
+            key = id(obj)
+            if key not in excel_names:
+                excel_names[key] = self.disambiguate_object(obj)
+            return excel_names[key]
+
+        def graph_object_extract_to_excel(self, input_node: Union[Group, Graph]):
+            """Extracting graph objects to excel (one appended row per object - name and id at the indent columns).
+            Walks nested groups with an explicit stack - rows in the same depth first order as the hierarchy."""
+            append_row = self.objects_ws.append
+            stack = [(input_node, 0)]  # (container, indent of the container's own row)
+            while stack:
+                container, indent_level = stack.pop()
+
+                # posting group to excel (top level container has no row)
+                if container is not input_node:
+                    append_row({indent_level: container.name, indent_level + 1: container.id})
+
+                # contained nodes share their columns - one indent deeper than the container
+                name_col = indent_level + 1
+                id_col = indent_level + 2
+                for node in container.nodes.values():
+                    # desc = node.get(description, "")
+                    # url = node.get(url, "")
+
+                    # posting to excel
+                    append_row({name_col: node.name, id_col: node.id})
+
+                # contained groups one indent deeper - reversed so they are popped in stored order
+                stack.extend((group, indent_level + 1) for group in reversed(container.groups.values()))
 
         def relations_extract_to_excel(self, input_node: Union[Group, Graph]):
-            """Extract relations recursively - providing owner if needed"""
-            nonlocal row
-
-            # Go through edges of this "owning" object
-            sub_edges = input_node.edges
-            for edge in sub_edges.values():
-                node1name = self.disambiguate_object(edge.node1)
-                node2name = self.disambiguate_object(edge.node2)
+            """Extract relations through the group hierarchy - providing owner if needed"""
+            append_relation = self.relations_ws.append
+            stack = [input_node]
+            while stack:
+                owner = stack.pop()
 
                 group_name = ""
-                if isinstance(input_node, Group):
-                    group_name = self.disambiguate_object(input_node)
+                if isinstance(owner, Group):
+                    group_name = excel_name(owner)
 
-                edge_name = self.disambiguate_object(edge)
+                # Go through edges of this "owning" object
+                for edge in owner.edges.values():
+                    node1name = excel_name(edge.node1)
+                    node2name = excel_name(edge.node2)
+                    edge_name = excel_name(edge)
 
-                # post to excel
-                self.relations_ws.cell(row=row, column=col, value=node1name)
-                self.relations_ws.cell(row=row, column=col + 1, value=node2name)
-                self.relations_ws.cell(row=row, column=col + 2, value=edge_name)
-                self.relations_ws.cell(row=row, column=col + 3, value=group_name)
-                row += 1
+                    # post to excel
+                    append_relation([node1name, node2name, edge_name, group_name])
 
-            # Go to next level of relations / ownership - recursive
-            sub_groups = input_node.groups
-            for group in sub_groups.values():
-                relations_extract_to_excel(self, group)
+                # Go to next level of relations / ownership - reversed so groups are popped in stored order
+                stack.extend(reversed(owner.groups.values()))
 
-        # Perform the transformation to excel ========================
+        # Perform the transformation to excel (rows appended below the template header) ========================
         if self.type == "obj_and_hierarchy" or self.type == "relations":
-            row = 2
-            graph_object_extract_to_excel(self, self.graph, indent_level=1)
+            graph_object_extract_to_excel(self, self.graph)
 
         if self.type == "relations":
-            row = 2
-            col = 1
             relations_extract_to_excel(self, self.graph)
 
     @open_close_excel(save=False)
     def excel_to_graph_conversion(self, type: Optional[str] = None, excel_data=None):
-        """Converting excel sheet data back into graph object."""
-        self.bulk_data_op_verify(type)
+        """Converting excel sheet data back into graph object.
+        The workbook is opened read only - sheets are consumed as streamed row values."""
 
         # Update original stats
         self.original_stats = self.graph.gather_graph_stats()
 
         # Begin transformation from excel to graph ========================
         if self.type == "obj_and_hierarchy":
-            # Pull out object data
-            obj_data = list(self.objects_ws.values)
-            obj_data.pop(0)  # remove header
+            # Pull out object data (below the header row)
+            obj_data = list(self.objects_ws.iter_rows(min_row=2, values_only=True))
 
-            # identifying indents in excel (marker for groupings)
+            # identifying indents in excel (marker for groupings) - count of leading empty cells per row
             indent: list[int] = []
             for row in obj_data:
                 none_i = 0
                 for val in row:
-                    if val == None:
-                        none_i += 1
-                    else:
+                    if val is not None:  # identity test - no rich comparison against cell values
                         break  # per row for
+                    none_i += 1
                 indent.append(none_i)
 
             # identifying groups
@@ -1240,32 +1373,27 @@ class ExcelManager:
             group_identifiers.append(0)  # small limitation - deepest or last cannot be group - must have submembers
 
             # sorting ownership based on indents/groups
+            # owner is the nearest preceding group one indent up - tracked as the last group row seen per indent
             owner_indexing: dict[int, Union[int, None]] = dict()
-            indent_and_group_ident = list(zip(indent, group_identifiers))
-            for i in range(0, num_items):
-                owner_indexing[i] = None
-                if i == 0:
-                    continue
-                curr_indent = indent[i]
-                for j, (indent_i, is_group) in enumerate(reversed(indent_and_group_ident[:i])):
-                    if indent_i == curr_indent - 1 and is_group == 1:
-                        owner_indexing[i] = i - (j + 1)
-                        break
+            last_group_at_indent: dict[int, int] = dict()
+            for i, (curr_indent, is_group) in enumerate(zip(indent, group_identifiers)):
+                owner_indexing[i] = last_group_at_indent.get(curr_indent - 1)
+                if is_group == 1:
+                    last_group_at_indent[curr_indent] = i
 
             # Building / Modifying objects
             objects = list()
             object_id_mappings: dict[str, str] = dict()
             id_replaced_by_other_mapping: dict[str, Union[(Node, Group)]] = dict()
-            # all_bulk_mod_ids = set()
-            # all_curr_obj_ids = set(self.original_id_to_obj.keys())
+            all_bulk_mod_ids: set[str] = set()  # existing ids still referenced in excel
             for i, (starting_indent, gr_i, obj_row) in enumerate(zip(indent, group_identifiers, obj_data)):
                 # Extracting label and id
                 name = obj_row[starting_indent]
                 id = None
-                try:
+                if len(obj_row) > starting_indent + 1:
                     id = obj_row[starting_indent + 1]
-                except Exception as e:
-                    print(f"Node missing Id: {e}.")
+                else:
+                    print("Node missing Id.")
 
                 # Checks
                 id_exists = id is not None
@@ -1301,6 +1429,7 @@ class ExcelManager:
 
                 elif id_exists:  # TODO: NEED TO FINISH THIS
                     existing_obj = self.original_stats.all_objects[id]  # FIXME:
+                    all_bulk_mod_ids.add(id)
 
                     # change from node -> group
                     if isinstance(existing_obj, Node) and is_group:
@@ -1362,50 +1491,64 @@ class ExcelManager:
 
             # Deleted objects - items previously with ids and ids are no longer there
             # Finding difference of ids - previous ids no longer there... #FIXME: WHAT ABOUT CHANGED IDS?
-            all_updated_obj = objects.copy()
-            all_orig_obj = list(self.original_stats.all_objects.values())
-            all_deleted_obj = [obj for obj in all_orig_obj if obj not in all_updated_obj]
-            for obj in all_deleted_obj:
-                parent = obj.parent or self.graph
-                if isinstance(obj, Group):  # group
-                    # find all immediate dependents and connect them to owner
-                    try:
-                        parent.remove_group(obj, heal=False)
-                    except Exception as e:
-                        warn("Group no longer existing - to remove")
-                elif isinstance(obj, Node):  # node
-                    try:
-                        parent.remove_node(obj)
-                    except Exception as e:
-                        warn("Node no longer existing - to remove")
+            all_curr_obj_ids = self.original_stats.all_objects.keys()
+            all_deleted_obj_ids = all_curr_obj_ids - all_bulk_mod_ids
+
+            # partition deleted objects by type once - nodes removed before their (possibly deleted) groups
+            deleted_nodes: List[Node] = []
+            deleted_groups: List[Group] = []
+            for obj_id in all_deleted_obj_ids:
+                obj = self.original_stats.all_objects[obj_id]
+                if isinstance(obj, Group):
+                    deleted_groups.append(obj)
+                elif isinstance(obj, Node):
+                    deleted_nodes.append(obj)
+
+            for node in deleted_nodes:
+                try:
+                    (node.parent or self.graph).remove_node(node)
+                except Exception as e:
+                    warn("Node no longer existing - to remove")
+
+            for group in deleted_groups:
+                # find all immediate dependents and connect them to owner
+                try:
+                    (group.parent or self.graph).remove_group(group, heal=False)
+                except Exception as e:
+                    warn("Group no longer existing - to remove")
 
             # Update all ids - after delete operations
             for obj in objects:
                 assign_traceable_id(obj)
 
         elif self.type == "relations":
-            # Access the relations sheet
-            self.relations_ws = self.excel_wb[self.RELATIONS_WS_NAME]
-            relations_data = self.relations_ws.values
-            row_length = None
+            # Access the relations sheet (handle provided by the decorator)
+            # rows after the header, always 4 values wide (missing cells padded as None)
+            relations_data = self.relations_ws.iter_rows(min_row=2, max_col=4, values_only=True)
 
             # declarations
             edge_ids_after_mod = set()
+            existing_graph_items = self.original_stats.all_graph_items
+            # only unambiguous (single id) names can be resolved by name
+            unique_name_to_obj = {
+                name: existing_graph_items[ids[0]]
+                for name, ids in self.original_stats.name_to_ids.items()
+                if len(ids) == 1
+            }
+
+            # Try to reidentify items ========================================
+            def find_checks(name, id):
+                """Find existing object by id (in case of disambiguation), else by unique name."""
+                result_object = existing_graph_items.get(id) if id else None
+                if result_object is None and name:
+                    result_object = unique_name_to_obj.get(name)
+                return result_object, result_object is not None
 
             # process sheet rows
-            count: int = 0
             for row in relations_data:
-                if count == 0:
-                    row_length = len(row)
-                    count += 1
-                    continue
-
                 # Declarations ===================================
-                # names
-                node1_name: str = ""
-                node2_name: str = ""
-                edge_name: str = ""
-                owner_name: str = ""
+                # names (before disambiguation) - cells cast to text once at read time, empty cells stay None
+                node1_name, node2_name, edge_name, owner_name = (None if value is None else str(value) for value in row)
 
                 # ids
                 node1_id: str = ""
@@ -1419,15 +1562,6 @@ class ExcelManager:
                 edge_found = False
                 owner_found = False
 
-                # separating row values into variables (before disambiguation)
-                if row_length == 4:
-                    node1_name, node2_name, edge_name, owner_name = row
-                    edge_id = str(edge_id)
-                elif row_length == 3:
-                    node1_name, node2_name, edge_name = row
-                elif row_length == 2:
-                    node1_name, node2_name = row
-
                 # Quick check if we are working with minimally complete data
                 # At this point the name is name(+id) - assumed we can ignore empty nodes / warn
                 two_node_check = node1_name is not None and node2_name is not None
@@ -1441,32 +1575,6 @@ class ExcelManager:
                 edge_name, edge_id = self.disambiguate_object(edge_name, direction="in")
                 owner_name, owner_id = self.disambiguate_object(owner_name, direction="in")
 
-                # Try to reidentify items ========================================
-                def find_checks(name, id):
-                    result_object = None
-                    id_found = False
-                    name_found = False
-
-                    # look for ID - in case of disambiguation
-                    if id:
-                        id_found = id in self.original_stats.all_graph_items.keys()
-                        if id_found:
-                            result_object = self.original_stats.all_graph_items[id]
-
-                    if not result_object:
-                        # Look by name
-                        if name:
-                            name_found = (
-                                name in self.original_stats.name_to_ids.keys()
-                                and not self.original_stats.name_reused(name)
-                            )
-                            if name_found:
-                                result_object = self.original_stats.all_graph_items[
-                                    self.original_stats.name_to_ids[name][0]
-                                ]
-
-                    return result_object, result_object is not None  # , any(id_found, name_found), id_found, name_found
-
                 # Looking for edge =================================
                 edge_object, edge_found = find_checks(edge_name, edge_id)
 
@@ -1532,9 +1640,7 @@ class ExcelManager:
                     edge_ids_after_mod.add(new_edge.id)
 
             # Deleting edges that have been deleted
-            all_bulk_edge_ids = set(list(self.original_stats.all_edges.keys()))
-            all_deleted_edge_ids = all_bulk_edge_ids.difference(edge_ids_after_mod)
-            for del_edge_id in all_deleted_edge_ids:
+            for del_edge_id in self.original_stats.all_edges.keys() - edge_ids_after_mod:
                 edge_obj: Edge = self.original_stats.all_edges[del_edge_id]
                 parent = edge_obj.parent or self.graph
                 parent.remove_edge(del_edge_id)
@@ -1552,6 +1658,7 @@ class ExcelManager:
 
         if show_guis:
             os.startfile(self.TEMP_EXCEL_SHEET)
+            self.kill_external_app = True
 
             user_response = msg.askokcancel(
                 title="yEd Bulk Data Management - Async", message="To process changes, save workbook and press ok."
@@ -1584,7 +1691,7 @@ class Graph:
 
         self.custom_properties = []
 
-        self.graphml: ET.Element
+        self.graphml: ET.Element  # set by construct_graphml / stringify_graph (persist_graph streams without it)
 
     # Addition of items ============================
     def add_node(self, node: Union[Node, str, None] = None, **kwargs) -> Node:
@@ -1644,77 +1751,97 @@ class Graph:
     # Graph functionalities ===========================
     def construct_graphml(self) -> None:
         """Creating template graphml xml structure and then placing all graph items into it."""
+        graphml, graph = self.graphml_template()
+
+        # Convert python graph objects into xml structure (created in place - nodes, groups, then edges)
+        for item in chain(self.nodes.values(), self.groups.values(), self.edges.values()):
+            item.populate_element(graph)
+
+        self.graphml = graphml
+
+    def graphml_template(self) -> tuple[ET.Element, ET.Element]:
+        """Creating template graphml xml structure (keys / definitions and empty graph node) - returns (graphml, graph)."""
 
         # Creating XML structure in Graphml format
         # xml = ET.Element("?xml", version="1.0", encoding="UTF-8", standalone="no")
 
-        graphml = ET.Element("graphml", xmlns="http://graphml.graphdrawing.org/xmlns")
-        graphml.set("xmlns:java", "http://www.yworks.com/xml/yfiles-common/1.0/java")
-        graphml.set("xmlns:sys", "http://www.yworks.com/xml/yfiles-common/markup/primitives/2.0")
-        graphml.set("xmlns:x", "http://www.yworks.com/xml/yfiles-common/markup/2.0")
-        graphml.set("xmlns:xsi", "http://www.w3.org/2001/XMLSchema-instance")
-        graphml.set("xmlns:y", "http://www.yworks.com/xml/graphml")
-        graphml.set("xmlns:yed", "http://www.yworks.com/xml/yed/3")
-        graphml.set(
-            "xsi:schemaLocation",
-            "http://graphml.graphdrawing.org/xmlns http://www.yworks.com/xml/schema/graphml/1.1/ygraphml.xsd",
+        graphml = ET.Element(
+            "graphml",
+            {
+                "xmlns": "http://graphml.graphdrawing.org/xmlns",
+                "xmlns:java": "http://www.yworks.com/xml/yfiles-common/1.0/java",
+                "xmlns:sys": "http://www.yworks.com/xml/yfiles-common/markup/primitives/2.0",
+                "xmlns:x": "http://www.yworks.com/xml/yfiles-common/markup/2.0",
+                "xmlns:xsi": "http://www.w3.org/2001/XMLSchema-instance",
+                "xmlns:y": "http://www.yworks.com/xml/graphml",
+                "xmlns:yed": "http://www.yworks.com/xml/yed/3",
+                "xsi:schemaLocation": (
+                    "http://graphml.graphdrawing.org/xmlns http://www.yworks.com/xml/schema/graphml/1.1/ygraphml.xsd"
+                ),
+            },
         )
 
         # Adding some implementation specific keys for identifying urls, descriptions
-        node_key = ET.SubElement(graphml, "key", id="data_node")
-        node_key.set("for", "node")
-        node_key.set("yfiles.type", "nodegraphics")
-
-        # Definition: url for Node
-        node_key = ET.SubElement(graphml, "key", id="url_node")
-        node_key.set("for", "node")
-        node_key.set("attr.name", "url")
-        node_key.set("attr.type", "string")
-
-        # Definition: description for Node
-        node_key = ET.SubElement(graphml, "key", id="description_node")
-        node_key.set("for", "node")
-        node_key.set("attr.name", "description")
-        node_key.set("attr.type", "string")
-
-        # Definition: url for Edge
-        node_key = ET.SubElement(graphml, "key", id="url_edge")
-        node_key.set("for", "edge")
-        node_key.set("attr.name", "url")
-        node_key.set("attr.type", "string")
-
-        # Definition: description for Edge
-        node_key = ET.SubElement(graphml, "key", id="description_edge")
-        node_key.set("for", "edge")
-        node_key.set("attr.name", "description")
-        node_key.set("attr.type", "string")
+        for key_attrib in GRAPHML_KEYS:
+            ET.SubElement(graphml, "key", key_attrib)
 
         # Definition: Custom Properties for Nodes and Edges
         for prop in self.custom_properties:
             graphml.append(prop.convert_to_xml())
 
-        edge_key = ET.SubElement(graphml, "key", id="data_edge")
-        edge_key.set("for", "edge")
-        edge_key.set("yfiles.type", "edgegraphics")
+        ET.SubElement(graphml, "key", GRAPHML_EDGE_GRAPHICS_KEY)
 
         # Graph node containing actual objects
-        graph = ET.SubElement(graphml, "graph", edgedefault=self.directed, id=self.id)
+        graph = ET.SubElement(graphml, "graph", {"edgedefault": self.directed, "id": self.id})
+
+        return graphml, graph
 
-        # Convert python graph objects into xml structure
+    def graph_items_xml(self):
+        """Generate xml of the top level graph items (nodes, groups, edges) in file order."""
         for node in self.nodes.values():
-            graph.append(node.convert_to_xml())
+            yield node.convert_to_xml()
 
         for node in self.groups.values():
-            graph.append(node.convert_to_xml())
+            yield node.convert_to_xml()
 
         for edge in self.edges.values():
-            graph.append(edge.convert_to_xml())
-
-        self.graphml = graphml
+            yield edge.convert_to_xml()
+
+    def stream_graphml(self, path, pretty_print=False) -> None:
+        """Write graphml to path one top level item at a time - only one item subtree is held in memory.
+        Pretty printing indents each item at its depth in the document (same output as indenting the whole tree)."""
+        graphml, graph = self.graphml_template()
+
+        with open(path, "wb", buffering=GRAPHML_WRITE_BUFFER_SIZE) as f:
+            # nothing to stream - template written whole (keeps the empty graph element self closing)
+            if not (self.nodes or self.groups or self.edges):
+                if pretty_print:
+                    ET.indent(graphml, space="\t")
+                ET.ElementTree(graphml).write(f, encoding="utf-8", xml_declaration=True)
+                return
+
+            # split template around a placeholder for the graph items
+            placeholder = ET.Comment("graph items")
+            marker = ET.tostring(placeholder, encoding="utf-8")  # taken before indenting adds a tail
+            graph.append(placeholder)
+            if pretty_print:
+                ET.indent(graphml, space="\t")
+            head, tail = ET.tostring(graphml, encoding="utf-8", xml_declaration=True).split(marker)
+            separator = ("\n" + 2 * "\t").encode() if pretty_print else b""  # items sit under graphml > graph
+
+            f.write(head)
+            for position, item in enumerate(self.graph_items_xml()):
+                if position:
+                    f.write(separator)
+                if pretty_print:
+                    ET.indent(item, space="\t", level=2)
+                f.write(ET.tostring(item, encoding="utf-8"))
+            f.write(tail)
 
     def persist_graph(self, file=None, pretty_print=False, overwrite=False) -> File:
         """Convert graphml object->xml tree->graphml file.
         Temporary naming used if not given.
+        The file is streamed (see stream_graphml) - self.graphml is not set, use construct_graphml for the xml tree.
         """
 
         graph_file = File(file)
@@ -1722,16 +1849,7 @@ class Graph:
         if graph_file.file_exists and not overwrite:
             raise FileExistsError
 
-        self.construct_graphml()
-
-        if pretty_print:
-            raw_str = ET.tostring(self.graphml)
-            pretty_str = minidom.parseString(raw_str).toprettyxml()
-            with open(graph_file.fullpath, "w") as f:
-                f.write(pretty_str)
-        else:
-            tree = ET.ElementTree(self.graphml)
-            tree.write(graph_file.fullpath)  # Uses internal method to XML Etree
+        self.stream_graphml(graph_file.fullpath, pretty_print=pretty_print)
 
         # recheck the file as existing or not
         graph_file.full_path_validate()
@@ -1748,9 +1866,13 @@ class Graph:
             return ET.tostring(self.graphml, encoding="UTF-8").decode()
 
     def from_existing_graph(self, file: str | File):
-        """Parse GraphML xml of existing/stored graph file into python Graph structure."""
+        """Parse GraphML xml of existing/stored graph file into python Graph structure.
+        The file is streamed - each top level item is built into the graph once parsed, then its xml is released."""
 
         id_existing_to_graph_obj = dict()
+        pending_edges = []  # (owner, edge id, source id, target id, edge init dict) - created after all nodes / groups
+        key_attr = dict()  # key id -> attr.name (url, description, ...)
+        new_graph = None
 
         # Manage file input ==============================
         if isinstance(file, File):
@@ -1760,267 +1882,279 @@ class Graph:
         if not graph_file.file_exists:
             raise FileNotFoundError
 
-        # Simplify input into string ==============================
-        graph_str = xml_to_simple_string(graph_file.fullpath)
-
-        # Begin XML parsing
-        root = ET.fromstring(graph_str)
-
-        # Extract off key information==============================
-        all_keys = root.findall("key")
-        key_dict = dict()
-        for a_key in all_keys:
-            sub_key_dict = dict()
-
-            key_id = a_key.attrib.get("id")
-            # sub_key_dict["label"] = a_key.attrib.get("for")
-            sub_key_dict["attr"] = a_key.attrib.get("attr.name", None)
-            # sub_key_dict["label"] = a_key.attrib.get("type")
-            key_dict[key_id] = sub_key_dict
-
-        # Get major graph node
-        graph_root = root.find("graph")
-
-        # get major graph info
-        graph_dir = graph_root.get("edgedefault")
-        graph_id = graph_root.get("id")
-
-        # instantiate graph object
-        new_graph = Graph(directed=graph_dir, id=graph_id)
-
         # Parse graph
 
         def is_group_node(node):
             return "foldertype" in node.attrib
 
         def process_node(parent, input_node):
-            # Get sub nodes of this node (group or graph)
-            current_level_nodes = input_node.findall("node")
-            current_level_edges = input_node.findall("edge")
-
-            for node in current_level_nodes:
-                # normal nodes
-                if not is_group_node(node):
-                    node_init_dict = dict()
-
-                    # <node id="n1">
-                    existing_node_id = node.attrib.get("id", None)  # FIXME:
-
-                    data_nodes = node.findall("data")
-                    info_node = None
-                    for data_node in data_nodes:
-                        info_node = data_node.find("GenericNode") or data_node.find("ShapeNode")
-                        if info_node is not None:
-                            node_init_dict["node_type"] = info_node.tag
-
-                            node_label = info_node.find("NodeLabel")
-                            if node_label is not None:
-                                node_init_dict["name"] = node_label.text
-
-                                # TODO: PORT REST OF NODELABEL
-
-                            # <Fill color="#FFCC00" transparent="false" />
-                            fill = info_node.find("Fill")
-                            if fill is not None:
-                                node_init_dict["shape_fill"] = fill.get("color")
-                                node_init_dict["transparent"] = fill.get("transparent")
-
-                            # <BorderStyle color="#000000" type="line" width="1.0" />
-                            border_style = info_node.find("BorderStyle")
-                            if border_style is not None:
-                                node_init_dict["border_color"] = border_style.get("color")
-                                node_init_dict["border_type"] = border_style.get("type")
-                                node_init_dict["border_width"] = border_style.get("width")
-
-                            # <Shape type="rectangle" />
-                            shape_sub = info_node.find("Shape")
-                            if shape_sub is not None:
-                                node_init_dict["shape"] = shape_sub.get("type")
-
-                            uml = info_node.find("UML")
-                            if uml is not None:
-                                node_init_dict["shape"] = uml.get("AttributeLabel")
-                            # TODO: THERE IS FURTHER DETAIL TO PARSE HERE under uml
-                        else:
-                            info = data_node.text
-                            if info is not None:
-                                info = re.sub(r"<!\[CDATA\[", "", info)  # unneeded schema
-                                info = re.sub(r"\]\]>", "", info)  # unneeded schema
-
-                                the_key = data_node.attrib.get("key")
-
-                                info_type = key_dict[the_key]["attr"]
-                                if info_type in ["url", "description"]:
-                                    node_init_dict[info_type] = info
-                    # Removing empty items
-                    node_init_dict = {key: value for (key, value) in node_init_dict.items() if value is not None}
-                    # create node
-                    new_node = parent.add_node(**node_init_dict)
-                    id_existing_to_graph_obj[existing_node_id] = new_node
-
-                # group nodes
-                # <node id="n2" yfiles.foldertype="group">
-                elif is_group_node(node):
-                    group_init_dict = dict()
-
-                    # <node id="n1">
-                    existing_group_id = node.attrib.get("id", None)
-
-                    # Actual Group Data ===================================
-                    data_nodes = node.findall("data")
-                    for data_node in data_nodes:
-                        proxy = data_node.find("ProxyAutoBoundsNode")
-                        if proxy is not None:
-                            realizer = proxy.find("Realizers")
-
-                            group_nodes = realizer.findall("GroupNode")
-
-                            for group_node in group_nodes:
-                                geom_node = group_node.find("Geometry")
-                                if geom_node is not None:
-                                    group_init_dict["height"] = geom_node.attrib.get("height", None)
-                                    group_init_dict["width"] = geom_node.attrib.get("width", None)
-                                    group_init_dict["x"] = geom_node.attrib.get("x", None)
-                                    group_init_dict["y"] = geom_node.attrib.get("y", None)
-
-                                fill_node = group_node.find("Fill")
-                                if fill_node is not None:
-                                    group_init_dict["fill"] = fill_node.attrib.get("color", None)
-                                    group_init_dict["transparent"] = fill_node.attrib.get("transparent", None)
-
-                                borderstyle_node = group_node.find("BorderStyle")
-                                if borderstyle_node is not None:
-                                    group_init_dict["border_color"] = borderstyle_node.attrib.get("color", None)
-                                    group_init_dict["border_type"] = borderstyle_node.attrib.get("type", None)
-                                    group_init_dict["border_width"] = borderstyle_node.attrib.get("width", None)
-
-                                nodelabel_node = group_node.find("NodeLabel")
-                                if nodelabel_node is not None:
-                                    group_init_dict["name"] = (
-                                        nodelabel_node.text
-                                    )  # TODO: SHOULD THIS JUST BE THE FIRST ONE?  IN OTHER WORDS - IS THERE MULTIPLE THINGS TO BE CAUGHT HERE?
-                                    group_init_dict["font_family"] = nodelabel_node.attrib.get("fontFamily", None)
-                                    group_init_dict["font_size"] = nodelabel_node.attrib.get("fontSize", None)
-                                    group_init_dict["underlined_text"] = nodelabel_node.attrib.get(
-                                        "underlinedText", None
-                                    )
-                                    group_init_dict["font_style"] = nodelabel_node.attrib.get("fontStyle", None)
-                                    group_init_dict["label_alignment"] = nodelabel_node.attrib.get("alignment", None)
-
-                                group_shape_node = group_node.find("Shape")
-                                if group_shape_node is not None:
-                                    group_init_dict["shape"] = group_shape_node.attrib.get("type", None)
-
-                                group_state_node = group_node.find("State")
-                                if group_state_node is not None:
-                                    group_init_dict["closed"] = group_state_node.attrib.get("closed", None)
-                                    # group_init_dict["aaa"] = group_state_node.attrib.get("closedHeight",None)
-                                    # group_init_dict["aaaa"] = group_state_node.attrib.get("closedWidth",None)
-                                    # group_init_dict["aaaa"] = group_state_node.attrib.get("innerGraphDisplayEnabled",None)
-
-                                break
-
-                        else:
-                            info = data_node.text
-                            if info is not None:
-                                info = re.sub(r"<!\[CDATA\[", "", info)  # unneeded schema
-                                info = re.sub(r"\]\]>", "", info)  # unneeded schema
-
-                                the_key = data_node.attrib.get("key")
-
-                                info_type = key_dict[the_key]["attr"]
-                                if info_type in ["url", "description"]:
-                                    group_init_dict[info_type] = info
-
-                    # Group - Graph node
-                    sub_graph_node = node.find("graph")
-
-                    # Removing empty items
-                    group_init_dict = {key: value for (key, value) in group_init_dict.items() if value is not None}
-
-                    # Creating new group
-                    new_group = parent.add_group(**group_init_dict)
-                    id_existing_to_graph_obj[existing_group_id] = new_group
-
-                    # Recursive processing
-                    if sub_graph_node is not None:
-                        process_node(parent=new_group, input_node=sub_graph_node)
-
-                # unknown node type
-                else:
-                    raise NotImplementedError
+            """Process the nodes / groups / edges contained in a graph element (nested graph of a group)."""
+            for node in input_node.findall("node"):
+                process_node_element(parent, node)
+
+            for edge_node in input_node.findall("edge"):
+                queue_edge(parent, edge_node)
 
-            # edges then establish connections
-            for edge_node in current_level_edges:
-                edge_init_dict = dict()
+        def process_node_element(parent, node):
+            # normal nodes
+            if not is_group_node(node):
+                node_init_dict = dict()
 
                 # <node id="n1">
-                edge_id = edge_node.attrib.get("id", None)
-                node1_id = edge_node.attrib.get("source", None)
-                node2_id = edge_node.attrib.get("target", None)
+                existing_node_id = node.attrib.get("id", None)  # FIXME:
 
-                try:
-                    edge_init_dict["node1"] = id_existing_to_graph_obj.get(node1_id)
-                    edge_init_dict["node2"] = id_existing_to_graph_obj.get(node2_id)
-                except Exception as e:  # TODO: MAKE MORE SPECIFIC
-                    print(f"One of nodes of existing edge {edge_id} not found: {node1_id}, {node2_id} ")
+                data_nodes = node.findall("data")
+                info_node = None
+                for data_node in data_nodes:
+                    info_node = data_node.find("GenericNode") or data_node.find("ShapeNode")
+                    if info_node is not None:
+                        node_init_dict["node_type"] = info_node.tag
+
+                        node_label = info_node.find("NodeLabel")
+                        if node_label is not None:
+                            node_init_dict["name"] = node_label.text
+
+                            # TODO: PORT REST OF NODELABEL
+
+                        # <Fill color="#FFCC00" transparent="false" />
+                        fill = info_node.find("Fill")
+                        if fill is not None:
+                            node_init_dict["shape_fill"] = fill.get("color")
+                            node_init_dict["transparent"] = fill.get("transparent")
+
+                        # <BorderStyle color="#000000" type="line" width="1.0" />
+                        border_style = info_node.find("BorderStyle")
+                        if border_style is not None:
+                            node_init_dict["border_color"] = border_style.get("color")
+                            node_init_dict["border_type"] = border_style.get("type")
+                            node_init_dict["border_width"] = border_style.get("width")
+
+                        # <Shape type="rectangle" />
+                        shape_sub = info_node.find("Shape")
+                        if shape_sub is not None:
+                            node_init_dict["shape"] = shape_sub.get("type")
+
+                        uml = info_node.find("UML")
+                        if uml is not None:
+                            node_init_dict["shape"] = uml.get("AttributeLabel")
+                        # TODO: THERE IS FURTHER DETAIL TO PARSE HERE under uml
+                    else:
+                        info = data_node.text
+                        if info is not None:
+                            info = info.replace("<![CDATA[", "").replace("]]>", "")  # unneeded schema
+
+                            the_key = data_node.attrib.get("key")
+
+                            info_type = key_attr.get(the_key)
+                            if info_type in ["url", "description"]:
+                                node_init_dict[info_type] = info
+                # Removing empty items
+                node_init_dict = {key: value for (key, value) in node_init_dict.items() if value is not None}
+                # create node
+                new_node = Node(**node_init_dict)
+                update_traceability(obj=new_node, owner=parent, operation="add")
+                id_existing_to_graph_obj[existing_node_id] = new_node
+
+            # group nodes
+            # <node id="n2" yfiles.foldertype="group">
+            elif is_group_node(node):
+                group_init_dict = dict()
 
-                # FIXME: HOW TO MOVE FROM NODE IDS TO NODE OBJECTS - MOVE THROUGH GRAPHML FOR THE TEXT OF THAT OBJECT? - OR USE A DICTIONARY
+                # <node id="n1">
+                existing_group_id = node.attrib.get("id", None)
 
-                # <data key="d5">
-                data_nodes = edge_node.findall("data")
+                # Actual Group Data ===================================
+                data_nodes = node.findall("data")
                 for data_node in data_nodes:
-                    polylineedge = data_node.find("PolyLineEdge")
-
-                    if polylineedge is not None:
-                        # TODO: ADD POSITION MANAGEMENT
-                        # path_node = polylineedge.find("Path")
-                        # if path_node:
-                        #   edge_init_dict["label"] = path_node.attrib.get("sx")
-                        #   edge_init_dict["label"] = path_node.attrib.get("sy")
-                        #   edge_init_dict["label"] = path_node.attrib.get("tx")
-                        #   edge_init_dict["label"] = path_node.attrib.get("ty")
-
-                        linestyle_node = polylineedge.find("LineStyle")
-                        if linestyle_node is not None:
-                            edge_init_dict["color"] = linestyle_node.attrib.get("color", None)
-                            edge_init_dict["line_type"] = linestyle_node.attrib.get("type", None)
-                            edge_init_dict["width"] = linestyle_node.attrib.get("width", None)
-
-                        arrows_node = polylineedge.find("Arrows")
-                        if arrows_node is not None:
-                            edge_init_dict["arrowfoot"] = arrows_node.attrib.get("source", None)
-                            edge_init_dict["arrowhead"] = arrows_node.attrib.get("target", None)
-
-                        edgelabel_node = polylineedge.find("EdgeLabel")
-                        if edgelabel_node is not None:
-                            edge_init_dict["label"] = edgelabel_node.text
-                            edge_init_dict["arrowfoot"] = edgelabel_node.attrib.get("source", None)
-                            edge_init_dict["arrowhead"] = edgelabel_node.attrib.get("target", None)
+                    proxy = data_node.find("ProxyAutoBoundsNode")
+                    if proxy is not None:
+                        realizer = proxy.find("Realizers")
+
+                        group_nodes = realizer.findall("GroupNode")
+
+                        for group_node in group_nodes:
+                            geom_node = group_node.find("Geometry")
+                            if geom_node is not None:
+                                group_init_dict["height"] = geom_node.attrib.get("height", None)
+                                group_init_dict["width"] = geom_node.attrib.get("width", None)
+                                group_init_dict["x"] = geom_node.attrib.get("x", None)
+                                group_init_dict["y"] = geom_node.attrib.get("y", None)
+
+                            fill_node = group_node.find("Fill")
+                            if fill_node is not None:
+                                group_init_dict["fill"] = fill_node.attrib.get("color", None)
+                                group_init_dict["transparent"] = fill_node.attrib.get("transparent", None)
+
+                            borderstyle_node = group_node.find("BorderStyle")
+                            if borderstyle_node is not None:
+                                group_init_dict["border_color"] = borderstyle_node.attrib.get("color", None)
+                                group_init_dict["border_type"] = borderstyle_node.attrib.get("type", None)
+                                group_init_dict["border_width"] = borderstyle_node.attrib.get("width", None)
+
+                            nodelabel_node = group_node.find("NodeLabel")
+                            if nodelabel_node is not None:
+                                group_init_dict["name"] = (
+                                    nodelabel_node.text
+                                )  # TODO: SHOULD THIS JUST BE THE FIRST ONE?  IN OTHER WORDS - IS THERE MULTIPLE THINGS TO BE CAUGHT HERE?
+                                group_init_dict["font_family"] = nodelabel_node.attrib.get("fontFamily", None)
+                                group_init_dict["font_size"] = nodelabel_node.attrib.get("fontSize", None)
+                                group_init_dict["underlined_text"] = nodelabel_node.attrib.get("underlinedText", None)
+                                group_init_dict["font_style"] = nodelabel_node.attrib.get("fontStyle", None)
+                                group_init_dict["label_alignment"] = nodelabel_node.attrib.get("alignment", None)
+
+                            group_shape_node = group_node.find("Shape")
+                            if group_shape_node is not None:
+                                group_init_dict["shape"] = group_shape_node.attrib.get("type", None)
+
+                            group_state_node = group_node.find("State")
+                            if group_state_node is not None:
+                                group_init_dict["closed"] = group_state_node.attrib.get("closed", None)
+                                # group_init_dict["aaa"] = group_state_node.attrib.get("closedHeight",None)
+                                # group_init_dict["aaaa"] = group_state_node.attrib.get("closedWidth",None)
+                                # group_init_dict["aaaa"] = group_state_node.attrib.get("innerGraphDisplayEnabled",None)
+
+                            break
 
                     else:
                         info = data_node.text
                         if info is not None:
-                            info = re.sub(r"<!\[CDATA\[", "", info)  # unneeded schema
-                            info = re.sub(r"\]\]>", "", info)  # unneeded schema
+                            info = info.replace("<![CDATA[", "").replace("]]>", "")  # unneeded schema
 
                             the_key = data_node.attrib.get("key")
 
-                            info_type = key_dict[the_key]["attr"]
+                            info_type = key_attr.get(the_key)
                             if info_type in ["url", "description"]:
-                                edge_init_dict[info_type] = info
+                                group_init_dict[info_type] = info
 
-                # bendstyle_node = polylineedge.find("BendStyle")
-                # edge_init_dict["smoothed"] = linestyle_node.attrib.get("smoothed") # TODO: ADD THIS
-
-                # TODO:
-                #   CUSTOM PROPERTIES
+                # Group - Graph node
+                sub_graph_node = node.find("graph")
 
                 # Removing empty items
-                edge_init_dict = {key: value for (key, value) in edge_init_dict.items() if value is not None}
-                parent.add_edge(**edge_init_dict)
+                group_init_dict = {key: value for (key, value) in group_init_dict.items() if value is not None}
+
+                # Creating new group
+                new_group = Group(**group_init_dict)
+                update_traceability(obj=new_group, owner=parent, operation="add")
+                id_existing_to_graph_obj[existing_group_id] = new_group
 
-        process_node(parent=new_graph, input_node=graph_root)
+                # Recursive processing
+                if sub_graph_node is not None:
+                    process_node(parent=new_group, input_node=sub_graph_node)
+
+            # unknown node type
+            else:
+                raise NotImplementedError
+
+        def queue_edge(parent, edge_node):
+            edge_init_dict = dict()
+
+            # <edge id="e0" source="n0" target="n1">
+            edge_id = edge_node.attrib.get("id", None)
+            node1_id = edge_node.attrib.get("source", None)
+            node2_id = edge_node.attrib.get("target", None)
+
+            # <data key="d5">
+            data_nodes = edge_node.findall("data")
+            for data_node in data_nodes:
+                polylineedge = data_node.find("PolyLineEdge")
+
+                if polylineedge is not None:
+                    # TODO: ADD POSITION MANAGEMENT
+                    # path_node = polylineedge.find("Path")
+                    # if path_node:
+                    #   edge_init_dict["label"] = path_node.attrib.get("sx")
+                    #   edge_init_dict["label"] = path_node.attrib.get("sy")
+                    #   edge_init_dict["label"] = path_node.attrib.get("tx")
+                    #   edge_init_dict["label"] = path_node.attrib.get("ty")
+
+                    linestyle_node = polylineedge.find("LineStyle")
+                    if linestyle_node is not None:
+                        edge_init_dict["color"] = linestyle_node.attrib.get("color", None)
+                        edge_init_dict["line_type"] = linestyle_node.attrib.get("type", None)
+                        edge_init_dict["width"] = linestyle_node.attrib.get("width", None)
+
+                    arrows_node = polylineedge.find("Arrows")
+                    if arrows_node is not None:
+                        edge_init_dict["arrowfoot"] = arrows_node.attrib.get("source", None)
+                        edge_init_dict["arrowhead"] = arrows_node.attrib.get("target", None)
+
+                    edgelabel_node = polylineedge.find("EdgeLabel")
+                    if edgelabel_node is not None:
+                        edge_init_dict["label"] = edgelabel_node.text
+                        edge_init_dict["arrowfoot"] = edgelabel_node.attrib.get("source", None)
+                        edge_init_dict["arrowhead"] = edgelabel_node.attrib.get("target", None)
+
+                else:
+                    info = data_node.text
+                    if info is not None:
+                        info = info.replace("<![CDATA[", "").replace("]]>", "")  # unneeded schema
+
+                        the_key = data_node.attrib.get("key")
+
+                        info_type = key_attr.get(the_key)
+                        if info_type in ["url", "description"]:
+                            edge_init_dict[info_type] = info
+
+            # bendstyle_node = polylineedge.find("BendStyle")
+            # edge_init_dict["smoothed"] = linestyle_node.attrib.get("smoothed") # TODO: ADD THIS
+
+            # TODO:
+            #   CUSTOM PROPERTIES
+
+            # endpoints resolved once all nodes / groups exist (may be anywhere in the hierarchy)
+            pending_edges.append((parent, edge_id, node1_id, node2_id, edge_init_dict))
+
+        # Stream file ==============================
+        # keys precede the graph - top level graph items are processed as each completes, then dropped
+        depth = 0
+        graph_element = None
+        in_graph = False
+        for event, elem in ET.iterparse(graph_file.fullpath, events=("start", "end")):
+            if event == "start":
+                depth += 1
+                # major graph node - its attributes are complete at start
+                if depth == 2 and simple_xml_name(elem.tag) == "graph" and new_graph is None:
+                    graph_element = elem
+                    in_graph = True
+                    new_graph = Graph(directed=elem.get("edgedefault"), id=elem.get("id"))
+                continue
+
+            simplify_graphml_element(elem)
+
+            # Extract off key information
+            if depth == 2 and elem.tag == "key":
+                key_attr[elem.get("id")] = elem.get("attr.name", None)
+
+            elif depth == 2 and elem is graph_element:
+                in_graph = False
+
+            elif depth == 3 and in_graph:
+                if elem.tag == "node":
+                    process_node_element(new_graph, elem)
+                elif elem.tag == "edge":
+                    queue_edge(new_graph, elem)
+                graph_element.remove(elem)  # release processed item
+
+            depth -= 1
+
+        if new_graph is None:
+            raise RuntimeWarning(f"No graph found in file: {graph_file.fullpath}")
+
+        # edges then establish connections (same per-owner order as the document)
+        for parent, edge_id, node1_id, node2_id, edge_init_dict in pending_edges:
+            node1 = id_existing_to_graph_obj.get(node1_id)
+            node2 = id_existing_to_graph_obj.get(node2_id)
+            if node1 is None or node2 is None:
+                warn(
+                    f"One of nodes of existing edge {edge_id} not found: {node1_id}, {node2_id}...skipping edge.",
+                    SyntaxWarning,
+                )
+                continue
+            edge_init_dict["node1"], edge_init_dict["node2"] = node1, node2
+
+            # Removing empty items
+            edge_init_dict = {key: value for (key, value) in edge_init_dict.items() if value is not None}
+            update_traceability(obj=Edge(**edge_init_dict), owner=parent, operation="add")
 
         return new_graph
 
@@ -2039,16 +2173,14 @@ class Graph:
 
         stats = self.gather_graph_stats()
 
-        def stranded_edges_check(self, graph_stats: GraphStats, correct: str) -> set[Edge]:
+        def stranded_edges_check(self, graph_stats: GraphStats, correct: str) -> List[Edge]:
             """Check for edges with no longer valid nodes (these will prevent yEd from opening the file).  Correct them automatically or manually."""
-            stranded_edges = set()
-            for edge_id, edge in graph_stats.all_edges.items():
-                node1_exist = edge.node1 in graph_stats.all_objects.values()
-                node2_exist = edge.node2 in graph_stats.all_objects.values()
-                at_least_one_edge = any([node1_exist, node2_exist])
-                stranded_edge = not all([node1_exist, node2_exist])
-                if stranded_edge:
-                    stranded_edges.add(edge)
+            stranded_edges = []
+            # identities of the live objects - one O(1) probe per edge end instead of scanning values
+            existing_objects = {id(obj) for obj in graph_stats.all_objects.values()}
+            for edge in graph_stats.all_edges.values():
+                if id(edge.node1) not in existing_objects or id(edge.node2) not in existing_objects:
+                    stranded_edges.append(edge)
 
             if correct == "auto":
                 for edge in stranded_edges:
@@ -2065,9 +2197,26 @@ class Graph:
 
 
 # App related functions ===========================
+yed_executable_path: Optional[str] = None
+
+# Process lookups are reused briefly - each lookup snapshots every process on the system
+YED_PROCESS_CACHE_TTL = 0.2  # seconds
+YED_EXIT_TIMEOUT = 5  # seconds to wait for a killed yEd process to exit
+yed_process_cached: Optional[psutil.Process] = None
+yed_process_checked_at: Optional[float] = None
+
+
+def find_yed_executable() -> Optional[str]:
+    """Locate yEd exe on path - found location is kept for the session (misses are re-checked, in case of install)."""
+    global yed_executable_path
+    if yed_executable_path is None:
+        yed_executable_path = which(PROGRAM_NAME)
+    return yed_executable_path
+
+
 def is_yed_findable():
     """Find yEd exe path locally"""
-    path = which(PROGRAM_NAME) or None
+    path = find_yed_executable()
     yed_found_bool = path is not None
     if not yed_found_bool:
         msg.showerror(
@@ -2087,15 +2236,53 @@ def get_yed_pid():
 
 
 def get_yed_process():
-    """Return process object for yEd application, if there is one running."""
+    """Return process object for yEd application, if there is one running.
+    Result reused for YED_PROCESS_CACHE_TTL seconds (reset when we start / stop yEd)."""
+    global yed_process_cached, yed_process_checked_at
+    now = monotonic()
+    if yed_process_checked_at is not None and now - yed_process_checked_at < YED_PROCESS_CACHE_TTL:
+        return yed_process_cached
+
     process = None
-    for process_iter in psutil.process_iter(["name"]):
-        if process_iter.info["name"] == PROGRAM_NAME:
-            process = process_iter
-            break
+    if sys.platform.startswith("linux"):
+        process = find_yed_process_in_proc()
+    else:
+        # no attrs requested - skips building an info dict per process (first match ends the scan)
+        for process_iter in psutil.process_iter():
+            try:
+                if process_iter.name() == PROGRAM_NAME:
+                    process = process_iter
+                    break
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+
+    yed_process_cached = process
+    yed_process_checked_at = now
     return process
 
 
+def find_yed_process_in_proc():
+    """Linux: find the yEd java process from process command lines in /proc (one small read per process)."""
+    for entry in os.scandir("/proc"):
+        if not entry.name.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry.name}/cmdline", "rb") as f:
+                cmdline = f.read().lower()
+            # an argument naming the jar (not just mentioning it)
+            if YED_JAR_NAME in cmdline and any(arg.endswith(YED_JAR_NAME) for arg in cmdline.split(b"\0")):
+                return psutil.Process(int(entry.name))
+        except (OSError, psutil.NoSuchProcess):
+            continue
+    return None
+
+
+def reset_yed_process_cache() -> None:
+    """Force the next yEd process lookup to rescan (after starting / stopping yEd)."""
+    global yed_process_checked_at
+    yed_process_checked_at = None
+
+
 def is_yed_open() -> bool:
     """Check whether yEd is currently open - windows, linux, os, etc."""
     return get_yed_pid() is not None
@@ -2129,11 +2316,13 @@ def open_yed_file(file: File, force=False):
         kill_yed()
 
     os.startfile(file.fullpath)
+    reset_yed_process_cache()
 
     if force:
         sleep(4)
         if get_yed_pid() is None:
             os.startfile(file.fullpath)
+            reset_yed_process_cache()
 
     return get_yed_process()
 
@@ -2151,10 +2340,12 @@ def start_yed(wait=False):
                     PROGRAM_NAME,
                 ]
                 process = start_subprocess(command)
+                reset_yed_process_cache()
 
                 return process or None
             else:
                 subprocess.run(PROGRAM_NAME)
+                reset_yed_process_cache()
                 return None
 
 
@@ -2162,77 +2353,147 @@ def kill_yed() -> None:
     """Ends yEd program (if installed and on path and open)."""
     yed_process = get_yed_process()
     if yed_process:
-        yed_process.kill()
+        try:
+            yed_process.kill()
+        except psutil.NoSuchProcess:
+            pass  # already gone
+        # block until the process has actually exited (no polling of the process table)
+        psutil.wait_procs([yed_process], timeout=YED_EXIT_TIMEOUT)
+        reset_yed_process_cache()
 
 
 # Utilities =======================================
 def xml_to_simple_string(file_path) -> str:
     """Takes GraphML xml in string format and reduces complexity of the string for simpler parsing (without loss of any significant information).  Returns simplified string."""
-    graph_str = ""
+    graph_bytes = b""
     try:
-        with open(file_path, "r") as graph_file:
-            graph_str = graph_file.read()
+        with open(file_path, "rb") as graph_file:
+            graph_bytes = graph_file.read()
 
     except FileNotFoundError:
         print(f"Error, file not found: {file_path}")
         raise FileNotFoundError(f"Error, file not found: {file_path}")
     else:
-        # Preprocessing of file for ease of parsing
-        graph_str = graph_str.replace("\n", " ")  # line returns
-        graph_str = graph_str.replace("\r", " ")  # line returns
-        graph_str = graph_str.replace("\t", " ")  # tabs
-        graph_str = re.sub("<graphml .*?>", "<graphml>", graph_str)  # unneeded schema
-        graph_str = graph_str.replace("> <", "><")  # empty text
-        graph_str = graph_str.replace("y:", "")  # unneeded namespace prefix
-        graph_str = graph_str.replace("xml:", "")  # unneeded namespace prefix
-        graph_str = graph_str.replace("yfiles.", "")  # unneeded namespace prefix
-        graph_str = re.sub(" {1,}", " ", graph_str)  # reducing redundant spaces
+        # Preprocessing of file for ease of parsing - single passes over raw bytes, decoded once at the end
+        graph_bytes = graph_bytes.replace(b"\r\n", b"\n")  # newlines as text mode reading would give them
+        graph_bytes = graph_bytes.translate(WHITESPACE_TO_SPACE_BYTES)  # line returns, tabs
+        graph_bytes = GRAPHML_OPENING_TAG_RE.sub(b"<graphml>", graph_bytes, count=1)  # unneeded schema
+        graph_bytes = graph_bytes.replace(b"> <", b"><")  # empty text
+        graph_bytes = NAMESPACE_PREFIX_RE.sub(b"", graph_bytes)  # unneeded namespace prefixes
+        graph_bytes = REDUNDANT_SPACES_BYTES_RE.sub(b" ", graph_bytes)  # reducing redundant spaces
+
+    return graph_bytes.decode("utf-8")
+
+
+def simple_xml_name(name: str) -> str:
+    """Drop namespace ({uri}) and yfiles. prefixes from a tag or attribute name."""
+    name = name.rpartition("}")[2]
+    if name.startswith(YFILES_ATTRIBUTE_PREFIX):
+        name = name[len(YFILES_ATTRIBUTE_PREFIX) :]
+    return name
+
 
-    return graph_str
+def simplify_graphml_element(elem: ET.Element) -> None:
+    """Simplify a parsed GraphML element in place as in xml_to_simple_string (no namespaces / prefixes, text whitespace collapsed)."""
+    elem.tag = simple_xml_name(elem.tag)
+
+    attrib = elem.attrib
+    if any("}" in key or key.startswith(YFILES_ATTRIBUTE_PREFIX) for key in attrib):
+        elem.attrib = {simple_xml_name(key): value for key, value in attrib.items()}
+
+    text = elem.text
+    if text is not None:
+        text = REDUNDANT_SPACES_RE.sub(" ", text.translate(WHITESPACE_TO_SPACE))
+        elem.text = text if text != " " else None  # whitespace between tags only
+
+
+temp_id_counter = count(1)
 
 
 def generate_temp_uuid() -> str:
-    """Temporary unique id for objects."""
-    return str(randint(1, 1000000))
+    """Temporary unique id for objects (monotonic - never collides within a session)."""
+    return str(next(temp_id_counter))
 
 
-def assign_traceable_id(obj) -> None:
+def assign_traceable_id(obj, new=False) -> None:
     """Creating unique traceable id for graph objects in similar format to yEd:
     n0, n1, ... for nodes and groups at a level
     e0, e1, ... for edges at a level
     n2::n2::n0 for nodes and groups at following level - full tracability
     n2::e0 for edges at following level - full tracability (lowest level ownership where linked)
+    new - object not yet logged under its owner: next number at that level, without searching the siblings
     """
     parent_id_prefix = ""
     if isinstance(obj.parent, Group):
-        parent_id_prefix = obj.parent.id + "::"
+        parent_id_prefix = f"{obj.parent.id}::"
 
     if isinstance(obj, Node) or isinstance(obj, Group):
-        # This object already logged under this owner - rename to order in list
-        if obj in list(obj.parent.combined_objects.values()):
-            obj_parent_index = list(obj.parent.combined_objects.values()).index(obj)
-            obj.id = (
-                parent_id_prefix + "n" + str(obj_parent_index)
-            )  # FIXME: HAS TO BE THE INDEX OF THIS ITEM IN THE LIST
-        # this item is new - appending to end of current dict - give new number for that level
-        else:
-            obj.id = parent_id_prefix + "n" + str(len(obj.parent.combined_objects))
+        prefix, siblings = "n", obj.parent.combined_objects
     elif isinstance(obj, Edge):
-        if obj in list(obj.parent.edges.values()):
-            obj_parent_index = list(obj.parent.edges.values()).index(obj)
-            obj.id = parent_id_prefix + "e" + str(obj_parent_index)
-        else:
-            obj.id = (
-                parent_id_prefix + "e" + str(len(obj.parent.edges))
-            )  # FIXME: HAS TO BE THE INDEX OF THIS ITEM IN THE LIST
+        prefix, siblings = "e", obj.parent.edges
+    else:
+        return
+
+    # This object already logged under this owner - rename to order in list
+    # otherwise it is new - appended to end of current dict - next number for that level
+    if new:
+        position = len(siblings)
+    else:
+        position = next((index for index, sibling in enumerate(siblings.values()) if sibling is obj), len(siblings))
+    obj.id = f"{parent_id_prefix}{prefix}{position}"
 
     print(obj.id)
 
 
+def assign_custom_properties(obj, definitions: dict, custom_properties: Optional[dict]) -> None:
+    """Set each defined custom property on the object - given value or the definition default.
+    Unknown keys are rejected up front."""
+    if custom_properties:
+        unknown_keys = custom_properties.keys() - definitions.keys()
+        if unknown_keys:
+            raise RuntimeWarning("key %s not recognised" % ", ".join(sorted(unknown_keys)))
+    else:
+        custom_properties = {}
+
+    for name, definition in definitions.items():
+        setattr(obj, name, custom_properties.get(name, definition.default_value))
+
+
+def store_node(node, owner) -> None:
+    """Log node under its id in the owner."""
+    owner.nodes[node.id] = node
+    owner.combined_objects[node.id] = node
+
+
+def store_group(group, owner) -> None:
+    """Log group under its id in the owner."""
+    owner.groups[group.id] = group
+    owner.combined_objects[group.id] = group
+
+
+def store_edge(edge, owner) -> None:
+    """Log edge under its id in the owner."""
+    owner.edges[edge.id] = edge
+
+
+# Owner side logging of an added object - by type (one dict lookup per add, subclasses via their mro)
+ADD_HANDLERS = {Node: store_node, Group: store_group, Edge: store_edge}
+
+
+def add_handler(obj):
+    """Owner side logging function for the object - None if it is not a graph item."""
+    handler = ADD_HANDLERS.get(type(obj))
+    if handler is None:
+        handler = next((ADD_HANDLERS[cls] for cls in type(obj).__mro__ if cls in ADD_HANDLERS), None)
+    return handler
+
+
 def update_traceability(obj, owner, operation, heal=True) -> None:
     """Updating ownership of object based on parent."""
 
     if operation == "add":
+        new = obj.parent is None  # never attached - cannot already be logged under the owner
+
         # Setting parent
         obj.parent = owner
         if isinstance(obj.parent, Group):
@@ -2240,16 +2501,11 @@ def update_traceability(obj, owner, operation, heal=True) -> None:
         else:
             obj.top_level_graph = obj.parent
 
-        assign_traceable_id(obj)
+        assign_traceable_id(obj, new=new)
 
-        if isinstance(obj, Node):
-            obj.parent.nodes[obj.id] = obj
-            obj.parent.combined_objects[obj.id] = obj
-        elif isinstance(obj, Group):
-            obj.parent.groups[obj.id] = obj
-            obj.parent.combined_objects[obj.id] = obj
-        elif isinstance(obj, Edge):
-            obj.parent.edges[obj.id] = obj
+        handler = add_handler(obj)
+        if handler is not None:
+            handler(obj, obj.parent)
 
     if operation == "remove":
         if isinstance(obj, Node):
@@ -2361,7 +2617,7 @@ def add_group(owner, group, **kwargs) -> Group:
 def remove_node(owner, node, **kwargs) -> None:
     """Remove/Delete a node - accepts node or node id"""
     if isinstance(node, Node):
-        if node not in owner.nodes.values():
+        if owner.nodes.get(node.id) is not node:  # stored under its id - O(1) identity check
             raise RuntimeWarning(f"Node {node.id} doesn't exist")
     if isinstance(node, str):
         if node not in owner.nodes:
@@ -2373,7 +2629,7 @@ def remove_node(owner, node, **kwargs) -> None:
 def remove_group(owner, group, **kwargs) -> None:
     """Removes a group from within current object."""
     if isinstance(group, Group):
-        if group not in owner.groups.values():
+        if owner.groups.get(group.id) is not group:  # stored under its id - O(1) identity check
             raise RuntimeWarning(f"Group {group.id} doesn't exist")
     if isinstance(group, str):
         if group not in owner.groups:
@@ -2386,7 +2642,7 @@ def remove_group(owner, group, **kwargs) -> None:
 def remove_edge(owner, edge, **kwargs) -> None:
     """Removing edge - uses id."""
     if isinstance(edge, Edge):
-        if edge not in owner.edges.values():
+        if owner.edges.get(edge.id) is not edge:  # stored under its id - O(1) identity check
             raise RuntimeWarning(f"Edge {edge.id} doesn't exist")
     if isinstance(edge, str):
         if edge not in owner.edges:
@@ -1083,3 +1083,387 @@ def test_node_geoms():
 
     if os.path.exists(file):
         os.remove(file)
+
+
+def test_graph_stats_follow_rename():
+    """
+    Given: graph with two differently named nodes
+    When: one node is renamed directly between two stats gatherings
+    Then: the second stats show the shared name"""
+
+    graph = Graph()
+    node_a = graph.add_node("a")
+    node_b = graph.add_node("b")
+
+    stats = graph.gather_graph_stats()
+    assert stats.duplicate_names == set()
+    assert stats.dup_ids == set()
+
+    node_b.name = "a"
+
+    stats = graph.gather_graph_stats()
+    assert stats.duplicate_names == {"a"}
+    assert stats.dup_ids == {node_a.id, node_b.id}
+    assert stats.name_to_ids["a"] == [node_a.id, node_b.id]
+
+
+def test_graph_rules_recheck_after_direct_edit():
+    """
+    Given: graph with an edge that passed the graph rules
+    When: the edge is rewired directly to a node outside the graph
+    Then: the next rules run catches and removes the stranded edge"""
+
+    graph = Graph()
+    node_a = graph.add_node("a")
+    node_b = graph.add_node("b")
+    edge = graph.add_edge(node_a, node_b)
+
+    graph.run_graph_rules()
+    assert list(graph.edges.values()) == [edge]
+
+    edge.node2 = Node("outside")
+
+    graph.run_graph_rules()
+    assert graph.edges == {}
+
+
+def test_ids_after_move_between_groups():
+    """
+    Given: two groups with nodes
+    When: a node is removed from one group and added to the other
+    Then: the id follows its position in the new group - adding again where it already is keeps the id"""
+
+    graph = Graph()
+    group1 = graph.add_group("group1")
+    group2 = graph.add_group("group2")
+    x = group1.add_node("x")
+    group1.add_node("y")
+    group2.add_node("z")
+
+    group1.remove_node(x)
+    group2.add_node(x)
+
+    assert x.parent is group2
+    assert x.id == f"{group2.id}::n1"
+    assert group2.combined_objects[x.id] is x
+    assert x not in group1.combined_objects.values()
+
+    group2.add_node(x)
+    assert x.id == f"{group2.id}::n1"
+    assert list(group2.combined_objects.values()).count(x) == 1
+
+
+NESTED_GRAPHML = """<?xml version="1.0" encoding="UTF-8" standalone="no"?>
+<graphml xmlns="http://graphml.graphdrawing.org/xmlns" xmlns:y="http://www.yworks.com/xml/graphml">
+  <key for="node" id="d5" attr.name="description" attr.type="string"/>
+  <key for="node" id="d6" yfiles.type="nodegraphics"/>
+  <graph edgedefault="directed" id="G">
+    <edge id="e0" source="n0" target="n1::n0"/>
+    <node id="n0">
+      <data key="d5"><![CDATA[node a]]></data>
+      <data key="d6"><y:ShapeNode><y:NodeLabel>a</y:NodeLabel></y:ShapeNode></data>
+    </node>
+    <node id="n1" yfiles.foldertype="group">
+      <data key="d6">
+        <y:ProxyAutoBoundsNode><y:Realizers active="0">
+          <y:GroupNode><y:NodeLabel>group</y:NodeLabel></y:GroupNode>
+        </y:Realizers></y:ProxyAutoBoundsNode>
+      </data>
+      <graph edgedefault="directed" id="n1:">
+        <edge id="n1::e0" source="n1::n0" target="n1::n1::n0"/>
+        <node id="n1::n0">
+          <data key="d6"><y:ShapeNode><y:NodeLabel>b</y:NodeLabel></y:ShapeNode></data>
+        </node>
+        <node id="n1::n1" yfiles.foldertype="group">
+          <data key="d6">
+            <y:ProxyAutoBoundsNode><y:Realizers active="0">
+              <y:GroupNode><y:NodeLabel>subgroup</y:NodeLabel></y:GroupNode>
+            </y:Realizers></y:ProxyAutoBoundsNode>
+          </data>
+          <graph edgedefault="directed" id="n1::n1:">
+            <node id="n1::n1::n0">
+              <data key="d6"><y:ShapeNode><y:NodeLabel>c</y:NodeLabel></y:ShapeNode></data>
+            </node>
+          </graph>
+        </node>
+      </graph>
+    </node>
+  </graph>
+</graphml>
+"""
+
+
+def test_from_existing_graph_nested_groups():
+    """
+    Given: graphml file with nested groups and edges declared before their end nodes
+    When: the file is read into a graph
+    Then: hierarchy, edges and ids are rebuilt"""
+
+    file = "temp.graphml"
+    with open(file, "w", encoding="utf-8") as f:
+        f.write(NESTED_GRAPHML)
+
+    graph = Graph().from_existing_graph(file)
+    os.remove(file)
+
+    assert graph.id == "G"
+
+    (a,) = graph.nodes.values()
+    (group,) = graph.groups.values()
+    (b,) = group.nodes.values()
+    (subgroup,) = group.groups.values()
+    (c,) = subgroup.nodes.values()
+    assert [a.name, group.name, b.name, subgroup.name, c.name] == ["a", "group", "b", "subgroup", "c"]
+    assert [a.id, group.id, b.id, subgroup.id, c.id] == ["n0", "n1", "n1::n0", "n1::n1", "n1::n1::n0"]
+    assert a.description == "node a"
+    assert b.parent is group and subgroup.parent is group and c.parent is subgroup
+    assert c.top_level_graph is graph
+
+    (edge,) = graph.edges.values()
+    assert edge.id == "e0"
+    assert edge.node1 is a and edge.node2 is b
+
+    (group_edge,) = group.edges.values()
+    assert group_edge.id == "n1::e0"
+    assert group_edge.node1 is b and group_edge.node2 is c
+
+
+def test_from_existing_graph_edge_missing_node():
+    """
+    Given: graphml file with an edge to a node that does not exist
+    When: the file is read into a graph
+    Then: a warning names the edge, which is skipped - other edges are kept"""
+
+    file = "temp.graphml"
+    with open(file, "w", encoding="utf-8") as f:
+        f.write(NESTED_GRAPHML.replace('target="n1::n0"', 'target="n9"'))
+
+    with pytest.warns(SyntaxWarning, match="edge e0 not found: n0, n9"):
+        graph = Graph().from_existing_graph(file)
+    os.remove(file)
+
+    assert graph.edges == {}
+    (group,) = graph.groups.values()
+    assert len(group.edges) == 1
+
+
+def streamed_and_written_graphml(graph, pretty_print):
+    """Test helper function - (streamed file bytes, bytes of the constructed tree written whole)"""
+    file = "temp.graphml"
+    graph.stream_graphml(file, pretty_print=pretty_print)
+    with open(file, "rb") as f:
+        streamed = f.read()
+    os.remove(file)
+
+    graph.construct_graphml()
+    if pretty_print:
+        xml.indent(graph.graphml, space="\t")
+    written = io.BytesIO()
+    xml.ElementTree(graph.graphml).write(written, encoding="utf-8", xml_declaration=True)
+    return streamed, written.getvalue()
+
+
+@pytest.mark.parametrize("pretty_print", [False, True])
+def test_stream_graphml_matches_tree_write(pretty_print):
+    """
+    Given: graph with nodes, nested groups, edges and custom properties
+    When: graphml is streamed to file
+    Then: the bytes equal writing the whole constructed tree"""
+
+    graph = Graph()
+    graph.define_custom_property("node", "Evidence", "string", "")
+    a = graph.add_node("a", custom_properties={"Evidence": "e"})
+    b = graph.add_node("b", UML={"attributes": "x", "methods": "m()", "stereotype": "s"})
+    group = graph.add_group("group", description="gd")
+    c = group.add_node("c")
+    subgroup = group.add_group("subgroup")
+    d = subgroup.add_node("d")
+    graph.add_edge(a, b, name="ab", description="ed")
+    group.add_edge(c, d)
+    graph.add_edge(a, d)
+
+    streamed, written = streamed_and_written_graphml(graph, pretty_print)
+    yed.Node.custom_properties_defs.clear()
+    assert streamed == written
+
+
+@pytest.mark.parametrize("pretty_print", [False, True])
+def test_stream_graphml_matches_tree_write_empty(pretty_print):
+    """
+    Given: empty graph
+    When: graphml is streamed to file
+    Then: the bytes equal writing the whole constructed tree"""
+
+    streamed, written = streamed_and_written_graphml(Graph(), pretty_print)
+    assert streamed == written
+
+
+def test_yed_process_lookup_cache(monkeypatch):
+    """
+    Given: yEd process lookups against a controlled clock and process table
+    When: looking up repeatedly, and starting / opening a file in / killing yEd
+    Then: lookups are reused within the cache time only, and starting / opening / killing forces a fresh lookup"""
+
+    class FakeYedProcess:
+        pid = 1234
+        killed = False
+
+        def name(self):
+            return yed.PROGRAM_NAME
+
+        def kill(self):
+            self.killed = True
+            running[0] = None
+
+    clock = [100.0]
+    running = [None]
+    lookups = []
+    yed_process = FakeYedProcess()
+
+    def lookup():
+        lookups.append(clock[0])
+        return running[0]
+
+    monkeypatch.setattr(yed, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(yed, "find_yed_process_in_proc", lookup)  # linux
+    monkeypatch.setattr(yed.psutil, "process_iter", lambda: iter([p for p in [lookup()] if p]))  # other platforms
+    yed.reset_yed_process_cache()
+
+    # expiry
+    assert yed.get_yed_process() is None
+    clock[0] += yed.YED_PROCESS_CACHE_TTL / 2
+    assert yed.get_yed_process() is None
+    assert len(lookups) == 1
+    clock[0] += yed.YED_PROCESS_CACHE_TTL
+    assert yed.get_yed_process() is None
+    assert len(lookups) == 2
+
+    # start - clock not moved, the cached "not running" would otherwise still be returned
+    def start_subprocess(command):
+        running[0] = yed_process
+        return "started"
+
+    monkeypatch.setattr(yed, "find_yed_executable", lambda: yed.PROGRAM_NAME)
+    monkeypatch.setattr(yed, "start_subprocess", start_subprocess)
+    assert yed.start_yed() == "started"
+    assert yed.get_yed_process() is yed_process
+
+    # kill
+    monkeypatch.setattr(yed.psutil, "wait_procs", lambda procs, timeout: (procs, []))
+    yed.kill_yed()
+    assert yed_process.killed
+    assert yed.get_yed_process() is None
+
+    # open file
+    file = "temp.graphml"
+    Graph().persist_graph(file, overwrite=True)
+    monkeypatch.setattr(yed.os, "startfile", lambda path: running.__setitem__(0, yed_process), raising=False)
+    assert yed.open_yed_file(File(file)) is yed_process
+    os.remove(file)
+
+    yed.reset_yed_process_cache()
+
+
+def test_excel_round_trip_duplicate_names():
+    """
+    Given: graph with two nodes sharing a name (top level and in a group)
+    When: converted to excel and back (objects, then relations)
+    Then: only the shared name objects are disambiguated with their ids and the graph is unchanged"""
+
+    graph = Graph()
+    dup1 = graph.add_node("dup")
+    b = graph.add_node("b")
+    group = graph.add_group("group")
+    dup2 = group.add_node("dup")
+    d = group.add_node("d")
+    graph.add_edge(dup1, dup2, name="e1")
+    graph.add_edge(b, dup1, name="e2")
+    group.add_edge(dup2, d, name="e3")
+
+    stats = graph.gather_graph_stats()
+    assert stats.duplicate_names == {"dup"}
+    assert stats.dup_ids == {dup1.id, dup2.id}
+
+    before_string = graph.stringify_graph()
+    for type in ["obj_and_hierarchy", "relations"]:
+        excel = ExcelManager()
+        excel.graph_to_excel_conversion(graph=graph, type=type)
+
+        workbook = pyxl.load_workbook(excel.TEMP_EXCEL_SHEET)
+        if type == "relations":
+            rows = list(workbook["Relations"].iter_rows(min_row=2, max_col=3, values_only=True))
+            separator = excel.DISAMBIGUATING_SEPARATOR
+            assert rows == [
+                ("dup" + separator + dup1.id, "dup" + separator + dup2.id, "e1"),
+                ("b", "dup" + separator + dup1.id, "e2"),
+                ("dup" + separator + dup2.id, "d", "e3"),
+            ]
+        workbook.close()
+
+        excel.excel_to_graph_conversion(type=type, excel_data=excel.TEMP_EXCEL_SHEET)
+        assert excel.graph is graph
+        assert graph.stringify_graph() == before_string
+
+        os.remove(excel.TEMP_EXCEL_SHEET)
+
+
+def test_add_subclassed_items():
+    """
+    Given: subclasses of Node, Group and Edge
+    When: instances are added to a graph
+    Then: they are logged and numbered like their base classes"""
+
+    class MyNode(Node):
+        pass
+
+    class MyGroup(yed.Group):
+        pass
+
+    class MyEdge(yed.Edge):
+        pass
+
+    graph = Graph()
+    node = graph.add_node(MyNode("x"))
+    group = graph.add_group(MyGroup("g"))
+    group_node = group.add_node(MyNode("y"))
+    edge = graph.add_edge(edge=MyEdge(node1=node, node2=group_node))
+
+    assert [node.id, group.id, group_node.id, edge.id] == ["n0", "n1", "n1::n0", "e0"]
+    assert graph.nodes == {"n0": node}
+    assert graph.groups == {"n1": group}
+    assert graph.combined_objects == {"n0": node, "n1": group}
+    assert group.nodes == {"n1::n0": group_node}
+    assert graph.edges == {"e0": edge}
+
+
+def test_geom_defaults_to_empty_dict():
+    """
+    Given: node and group created without geometry
+    When: reading / filling their geom
+    Then: geom is an empty dict that can be filled in and is then written out"""
+
+    graph = Graph()
+    node = graph.add_node("a")
+    group = graph.add_group("g")
+    assert node.geom == {}
+    assert group.geom == {}
+    assert node.geom.get("x") is None
+
+    node.geom["x"] = "10"
+    graph_string = graph.stringify_graph()
+    assert 'x="10"' in graph_string
+    assert graph_string.count("y:Geometry") == 1
+
+
+def test_label_with_unhashable_or_numeric_arguments():
+    """
+    Given: label arguments that are not strings (unhashable list, numbers equal as keys)
+    When: labels are created
+    Then: each label keeps its own given values"""
+
+    label = yed.NodeLabel("a", font_family=["Dialog", "Arial"])
+    assert label._params["fontFamily"] == ["Dialog", "Arial"]
+
+    assert yed.NodeLabel("b", font_size=12)._params["fontSize"] == 12
+    assert yed.NodeLabel("c", font_size=12.0)._params["fontSize"] == 12.0
+    assert isinstance(yed.NodeLabel("d", font_size=12.0)._params["fontSize"], float)